@@ -0,0 +1,48 @@
+"""Make user milestones unique per type
+
+Revision ID: 00d3b0d99cd6
+Revises: ee49f1763f74
+Create Date: 2026-10-15 03:27:58.077946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '00d3b0d99cd6'
+down_revision: Union[str, None] = 'ee49f1763f74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest award of each milestone before enforcing uniqueness
+    op.execute("""
+        DELETE FROM user_milestones m
+        USING user_milestones older
+        WHERE m.user_id = older.user_id
+          AND m.milestone_type = older.milestone_type
+          AND (m.earned_at, m.id) > (older.earned_at, older.id)
+    """)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_user_milestones_user_type',
+            'user_milestones',
+            ['user_id', 'milestone_type'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_user_milestones_user_type',
+            table_name='user_milestones',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,42 @@
+"""Add partial index for at-risk users listing
+
+Revision ID: 14861af15094
+Revises: b075b0aee86c
+Create Date: 2026-10-15 10:03:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '14861af15094'
+down_revision: Union[str, None] = 'b075b0aee86c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches get_at_risk_users: WHERE risk_level IN (...) ORDER BY last_risk_assessment DESC.
+    # Only elevated-risk users are indexed, so it stays small as users grows.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_at_risk',
+            'users',
+            [sa.text('last_risk_assessment DESC'), 'id'],
+            postgresql_where=sa.text("risk_level IN ('high', 'critical')"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_at_risk',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
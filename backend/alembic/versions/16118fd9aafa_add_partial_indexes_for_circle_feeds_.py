@@ -0,0 +1,104 @@
+"""Add partial indexes for circle feeds and unique path enrollments
+
+Revision ID: 16118fd9aafa
+Revises: 2a51bf7d8bcb
+Create Date: 2026-10-15 03:54:13.313688
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16118fd9aafa'
+down_revision: Union[str, None] = '2a51bf7d8bcb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest enrollment of each user in a path, then correct the
+    # denormalized enrollment counts the duplicates inflated
+    op.execute("""
+        DELETE FROM user_path_progress p
+        USING user_path_progress older
+        WHERE p.user_id = older.user_id
+          AND p.path_id = older.path_id
+          AND (p.started_at, p.id) > (older.started_at, older.id)
+    """)
+    op.execute("""
+        UPDATE paths
+        SET enrollment_count = counts.enrollments
+        FROM (
+            SELECT path_id, count(*) AS enrollments
+            FROM user_path_progress
+            GROUP BY path_id
+        ) counts
+        WHERE paths.id = counts.path_id
+          AND paths.enrollment_count <> counts.enrollments
+    """)
+    # The circle feed only shows visible top-level posts, so the partial
+    # index matches its predicate exactly and replaces the broader one.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_posts_circle_top_level_visible',
+            'posts',
+            ['circle_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('parent_id IS NULL AND is_hidden = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_posts_circle_top_level_created',
+            table_name='posts',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.create_index(
+            'ix_posts_parent_visible_created',
+            'posts',
+            ['parent_id', 'created_at'],
+            postgresql_where=sa.text('is_hidden = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'uq_user_path_progress_user_path',
+            'user_path_progress',
+            ['user_id', 'path_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_user_path_progress_user_path',
+            table_name='user_path_progress',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'ix_posts_parent_visible_created',
+            table_name='posts',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.create_index(
+            'ix_posts_circle_top_level_created',
+            'posts',
+            ['circle_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('parent_id IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_posts_circle_top_level_visible',
+            table_name='posts',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,60 @@
+"""Make post reactions unique per user
+
+Revision ID: 2a51bf7d8bcb
+Revises: 5bfc61cc836f
+Create Date: 2026-10-15 03:45:07.408243
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a51bf7d8bcb'
+down_revision: Union[str, None] = '5bfc61cc836f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest reaction of each user on a post, then correct the
+    # denormalized reaction counts the duplicates inflated
+    op.execute("""
+        DELETE FROM post_reactions r
+        USING post_reactions older
+        WHERE r.post_id = older.post_id
+          AND r.user_id = older.user_id
+          AND (r.created_at, r.id) > (older.created_at, older.id)
+    """)
+    op.execute("""
+        UPDATE posts p
+        SET reaction_count = counts.reactions
+        FROM (
+            SELECT post_id, count(*) AS reactions
+            FROM post_reactions
+            GROUP BY post_id
+        ) counts
+        WHERE p.id = counts.post_id
+          AND p.reaction_count <> counts.reactions
+    """)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_post_reactions_post_user',
+            'post_reactions',
+            ['post_id', 'user_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_post_reactions_post_user',
+            table_name='post_reactions',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
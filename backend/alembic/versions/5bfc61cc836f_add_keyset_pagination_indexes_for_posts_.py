@@ -0,0 +1,55 @@
+"""Add keyset pagination indexes for posts and paths
+
+Revision ID: 5bfc61cc836f
+Revises: be93a446808b
+Create Date: 2026-10-15 03:42:51.080089
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5bfc61cc836f'
+down_revision: Union[str, None] = 'be93a446808b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination seeks for list_circle_posts and list_paths; both sort keys
+    # end in id so the (key, id) < cursor comparison is a single index range.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_posts_circle_top_level_created',
+            'posts',
+            ['circle_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('parent_id IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_paths_enrollment_count',
+            'paths',
+            [sa.text('enrollment_count DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_paths_enrollment_count',
+            table_name='paths',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'ix_posts_circle_top_level_created',
+            table_name='posts',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
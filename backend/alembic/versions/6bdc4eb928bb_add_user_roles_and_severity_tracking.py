@@ -19,6 +19,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running queries on hot tables.
+    # SET LOCAL scopes both limits to this migration's transaction.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '60s'")
+    
     # Add role and peer supporter fields to users table
     op.add_column('users', sa.Column('role', sa.String(20), nullable=False, server_default='user'))
     op.add_column('users', sa.Column('is_moderator', sa.Boolean(), nullable=False, server_default='false'))
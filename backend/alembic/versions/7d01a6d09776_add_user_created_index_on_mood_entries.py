@@ -0,0 +1,40 @@
+"""Add user created index on mood entries
+
+Revision ID: 7d01a6d09776
+Revises: 00d3b0d99cd6
+Create Date: 2026-10-15 03:29:12.713608
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d01a6d09776'
+down_revision: Union[str, None] = '00d3b0d99cd6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Mood history, streak and trend queries all filter one user's recent entries
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mood_entries_user_created',
+            'mood_entries',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_mood_entries_user_created',
+            table_name='mood_entries',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
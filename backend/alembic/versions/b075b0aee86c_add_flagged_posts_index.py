@@ -0,0 +1,42 @@
+"""Add partial index for flagged posts listing
+
+Revision ID: b075b0aee86c
+Revises: 78d12f87d6d5
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b075b0aee86c'
+down_revision: Union[str, None] = '78d12f87d6d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches list_flagged_posts: WHERE is_flagged ORDER BY flag_severity DESC, created_at DESC.
+    # Built concurrently (outside the migration transaction) so posts stays writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_posts_flagged_severity_created',
+            'posts',
+            [sa.text('flag_severity DESC'), sa.text('created_at DESC')],
+            postgresql_where=sa.text('is_flagged = true'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_posts_flagged_severity_created',
+            table_name='posts',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,60 @@
+"""Make circle memberships unique per user
+
+Revision ID: be93a446808b
+Revises: 7d01a6d09776
+Create Date: 2026-10-15 03:38:20.643148
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'be93a446808b'
+down_revision: Union[str, None] = '7d01a6d09776'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest membership of each user in a circle, then correct the
+    # denormalized member counts the duplicates inflated
+    op.execute("""
+        DELETE FROM circle_memberships m
+        USING circle_memberships older
+        WHERE m.circle_id = older.circle_id
+          AND m.user_id = older.user_id
+          AND (m.joined_at, m.id) > (older.joined_at, older.id)
+    """)
+    op.execute("""
+        UPDATE circles c
+        SET member_count = counts.members
+        FROM (
+            SELECT circle_id, count(*) AS members
+            FROM circle_memberships
+            GROUP BY circle_id
+        ) counts
+        WHERE c.id = counts.circle_id
+          AND c.member_count <> counts.members
+    """)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_circle_memberships_circle_user',
+            'circle_memberships',
+            ['circle_id', 'user_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_circle_memberships_circle_user',
+            table_name='circle_memberships',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
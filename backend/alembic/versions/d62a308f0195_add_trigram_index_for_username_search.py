@@ -0,0 +1,44 @@
+"""Add trigram index for username search
+
+Revision ID: d62a308f0195
+Revises: f13965d86fb9
+Create Date: 2026-10-15 03:17:39.817684
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd62a308f0195'
+down_revision: Union[str, None] = 'f13965d86fb9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets list_all_users' username ILIKE '%...%' use an index instead of a seq scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_username_trgm',
+            'users',
+            ['username'],
+            postgresql_using='gin',
+            postgresql_ops={'username': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_username_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,41 @@
+"""Add conversation index on messages
+
+Revision ID: ee49f1763f74
+Revises: d62a308f0195
+Create Date: 2026-10-15 03:24:05.113790
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee49f1763f74'
+down_revision: Union[str, None] = 'd62a308f0195'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # messages had no index on conversation_id; serves conversation history and
+    # list_conversations' count / last-message subqueries
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_conversation_created',
+            'messages',
+            ['conversation_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_messages_conversation_created',
+            table_name='messages',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,40 @@
+"""Add path steps order index
+
+Revision ID: eea68a90e562
+Revises: 16118fd9aafa
+Create Date: 2026-10-15 03:56:12.595671
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eea68a90e562'
+down_revision: Union[str, None] = '16118fd9aafa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the Path.steps load: WHERE path_id IN (...) ORDER BY order_index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_path_steps_path_order',
+            'path_steps',
+            ['path_id', 'order_index'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_path_steps_path_order',
+            table_name='path_steps',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
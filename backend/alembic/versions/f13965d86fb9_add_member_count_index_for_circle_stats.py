@@ -0,0 +1,40 @@
+"""Add member count index for circle stats
+
+Revision ID: f13965d86fb9
+Revises: 14861af15094
+Create Date: 2026-10-15 03:12:12.552457
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f13965d86fb9'
+down_revision: Union[str, None] = '14861af15094'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches get_circle_stats: ORDER BY member_count DESC, id with OFFSET/LIMIT
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_circles_member_count',
+            'circles',
+            [sa.text('member_count DESC'), 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_circles_member_count',
+            table_name='circles',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -1,26 +1,76 @@
 """API dependencies"""
 
-from typing import Optional
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.db.session import get_db
+from app.db.session import get_db, AsyncSessionLocal
 from app.db.models.user import User
 from app.core.security import decode_access_token
 
 
 security = HTTPBearer()
 
+# Short-lived cache of detached User rows keyed by user id (str). The TTL
+# bounds how long an is_active/role change can go unnoticed on other workers.
+USER_CACHE_TTL = 5  # seconds
+USER_CACHE_MAXSIZE = 10_000
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token"""
-    token = credentials.credentials
+_user_cache: Dict[str, Tuple[float, User]] = {}
+_user_fetches: Dict[str, asyncio.Task] = {}
+
+
+async def _load_user(user_id: str) -> Optional[User]:
+    """Load a user on a private session so the row can be shared detached"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(User).where(User.id == user_id))
+        return result.scalar_one_or_none()
+
+
+def _store_fetched_user(user_id: str, task: asyncio.Task):
+    # Only the fetch still registered may populate the cache: one dropped by
+    # invalidate_cached_user may have read the row before the change committed
+    if _user_fetches.get(user_id) is not task:
+        return
+    del _user_fetches[user_id]
+    if task.cancelled() or task.exception() or task.result() is None:
+        return
+    if len(_user_cache) >= USER_CACHE_MAXSIZE:
+        _user_cache.pop(next(iter(_user_cache)))
+    _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, task.result())
+
+
+async def _fetch_user_cached(user_id: str) -> Optional[User]:
+    """
+    Return a detached User for user_id, hitting the database at most once
+    per TTL. Concurrent misses for the same id share a single query.
+    """
+    cached = _user_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
     
+    task = _user_fetches.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(_load_user(user_id))
+        task.add_done_callback(lambda t: _store_fetched_user(user_id, t))
+        _user_fetches[user_id] = task
+    
+    return await asyncio.shield(task)
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop a cached user, and any fetch in flight, after its row is modified"""
+    _user_cache.pop(str(user_id), None)
+    _user_fetches.pop(str(user_id), None)
+
+
+async def _authenticate(token: str) -> User:
+    """Resolve a bearer token to its (cached, detached) active user"""
     # Decode token
     payload = decode_access_token(token)
     if not payload:
@@ -37,9 +87,8 @@ async def get_current_user(
             detail="Invalid token payload"
         )
     
-    # Get user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Get user from cache or database
+    user = await _fetch_user_cached(user_id)
     
     if not user:
         raise HTTPException(
@@ -56,6 +105,31 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user from JWT token"""
+    user = await _authenticate(credentials.credentials)
+    
+    # Attach a copy to this request's session so handlers can modify it
+    return await db.merge(user, load=False)
+
+
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> UUID:
+    """
+    Get the authenticated user's id without attaching a User to the session
+    
+    For endpoints that only scope queries by user id. The active check still
+    runs against the shared user cache, so deactivation takes effect within
+    USER_CACHE_TTL.
+    """
+    user = await _authenticate(credentials.credentials)
+    return user.id
+
+
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db)
@@ -70,17 +144,15 @@ async def get_current_user_optional(
         return None
 
 
-async def get_current_user_ws(token: str, db: AsyncSession) -> Optional[User]:
-    """Get current user from WebSocket query param token"""
+def get_user_id_from_token(token: str) -> Optional[str]:
+    """
+    Get the user id a WebSocket query param token was issued for
+    
+    Only verifies the JWT; the caller loads and checks the user itself so it
+    can do so in the same query as its own lookups.
+    """
     payload = decode_access_token(token)
     if not payload:
         return None
     
-    user_id: str = payload.get("sub")
-    if not user_id:
-        return None
-    
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    return user if user and user.is_active else None
+    return payload.get("sub") or None
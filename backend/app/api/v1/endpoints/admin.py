@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, String
+from sqlalchemy import select, update, func, case, cast, literal, lambda_stmt, String
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from uuid import UUID
+import asyncio
+import orjson
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db, ReadSessionLocal
+from app.db.base import utcnow
 from app.db.models.user import User
 from app.db.models.post import Post
 from app.db.models.circle import Circle
@@ -13,19 +17,37 @@ from app.db.models.path import Path, UserPathProgress
 from app.db.models.mood import MoodEntry
 from app.db.models.conversation import Conversation
 from app.schemas.post import PostResponse
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_cached_user
+from app.services.cache_service import CacheService
 
-router = APIRouter()
+# Rows fetched per round-trip when streaming large admin listings
+STREAM_BATCH_SIZE = 100
+
+# Paginated listings report the unpaginated row count here, computed with
+# COUNT(*) OVER () in the page query itself
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+FLAG_SEVERITIES = ('critical', 'high', 'medium', 'low')
+
+# Risk levels covered by the ix_users_at_risk partial index
+ELEVATED_RISK_LEVELS = ('high', 'critical')
+
+# Dashboards are polled every few seconds but change on a minute scale;
+# moderation actions invalidate them explicitly
+DASHBOARD_CACHE_TTL = 60  # seconds
+
+_dashboard_locks: Dict[str, asyncio.Lock] = {}
 
 
 async def verify_admin(current_user: User = Depends(get_current_user)):
     """Verify user has admin or moderator privileges"""
-    if not current_user or current_user.is_anonymous:
+    # get_current_user already guarantees an existing, active user
+    if current_user.is_anonymous:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
-    if not (current_user.is_admin or current_user.is_moderator):
+    if not current_user.is_staff:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or moderator access required"
@@ -33,140 +55,226 @@ async def verify_admin(current_user: User = Depends(get_current_user)):
     return current_user
 
 
+router = APIRouter(dependencies=[Depends(verify_admin)])
+
+
 @router.get("/posts/flagged", response_model=List[PostResponse])
 async def list_flagged_posts(
+    response: Response,
     severity: str = None,  # Filter by severity: low, medium, high, critical
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List flagged posts with optional severity filter"""
-    query = select(Post).where(Post.is_flagged == True)
+    # Project only the PostResponse columns (no ORM hydration) and let
+    # Postgres render author_name. Built as a lambda statement so the
+    # expression tree is constructed once and reused from the cache.
+    query = lambda_stmt(lambda: select(
+        Post.id,
+        Post.circle_id,
+        Post.user_id,
+        Post.parent_id,
+        Post.content,
+        Post.is_anonymous,
+        Post.reaction_count,
+        Post.reply_count,
+        Post.is_flagged,
+        Post.is_hidden,
+        Post.created_at,
+        case(
+            (Post.is_anonymous == True, literal("Anonymous")),
+            else_=literal("User ") + cast(Post.user_id, String)
+        ).label("author_name"),
+        func.count().over().label("total")
+    ).where(Post.is_flagged == True))
     
     if severity:
-        query = query.where(Post.flag_severity == severity)
+        query += lambda s: s.where(Post.flag_severity == severity)
     
-    query = query.order_by(
+    query += lambda s: s.order_by(
         # Critical first, then by creation date
         Post.flag_severity.desc(),
         Post.created_at.desc()
     ).offset(skip).limit(limit)
     
-    result = await db.execute(query)
-    posts = result.scalars().all()
+    rows = await db.stream(
+        query, execution_options={"yield_per": STREAM_BATCH_SIZE}
+    )
+    
+    posts = []
+    total = 0
+    async for row in rows.mappings():
+        total = row["total"]
+        posts.append(PostResponse.model_validate(row))
     
-    response = []
-    for post in posts:
-        post_dict = PostResponse.model_validate(post).model_dump()
-        post_dict["author_name"] = "Anonymous" if post.is_anonymous else f"User {post.user_id}"
-        response.append(PostResponse(**post_dict))
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    return posts
+
+
+@router.patch("/posts/hide")
+async def hide_posts(
+    request: Request,
+    post_ids: List[UUID],
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(verify_admin)
+):
+    """Hide several flagged posts at once and mark them as reviewed"""
+    result = await db.execute(
+        update(Post)
+        .where(Post.id.in_(post_ids))
+        .values(
+            is_hidden=True,
+            reviewed_by_id=current_user.id,
+            reviewed_at=utcnow()
+        )
+        .returning(Post.id)
+    )
+    hidden_count = len(result.all())
+    await db.commit()
+    await _invalidate_dashboards(request)
     
-    return response
+    return {"hidden_count": hidden_count}
 
 
 @router.patch("/posts/{post_id}/hide", status_code=status.HTTP_204_NO_CONTENT)
 async def hide_post(
+    request: Request,
     post_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(verify_admin)
 ):
     """Hide a flagged post and mark as reviewed"""
-    result = await db.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
-    if not post:
+    result = await db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(
+            is_hidden=True,
+            reviewed_by_id=current_user.id,
+            reviewed_at=utcnow()
+        )
+        .returning(Post.id)
+    )
+    if not result.first():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
     
-    post.is_hidden = True
-    post.reviewed_by_id = current_user.id
-    post.reviewed_at = datetime.utcnow()
     await db.commit()
+    await _invalidate_dashboards(request)
 
 
 @router.patch("/posts/{post_id}/unhide", status_code=status.HTTP_204_NO_CONTENT)
 async def unhide_post(
+    request: Request,
     post_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """Unhide a post"""
-    result = await db.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
-    if not post:
+    result = await db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(is_hidden=False, is_flagged=False)
+        .returning(Post.id)
+    )
+    if not result.first():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
     
-    post.is_hidden = False
-    post.is_flagged = False
     await db.commit()
+    await _invalidate_dashboards(request)
+
+
+async def _one(query):
+    """Run a single read-only aggregate row on its own pooled session.
+
+    One ``AsyncSession`` serializes its statements, so independent
+    aggregates each get a session of their own to run concurrently.
+    """
+    async with ReadSessionLocal() as session:
+        result = await session.execute(query)
+        return result.one()
 
 
-@router.get("/analytics", response_model=Dict[str, Any])
+async def _cached_dashboard(request: Request, name: str, compute) -> Response:
+    """
+    Serve a dashboard payload from Redis, shared by all admins and workers.
+    Concurrent misses within this process share a single recomputation.
+    The payload is cached as encoded JSON and sent as-is, so hits are never
+    decoded and re-serialized.
+    """
+    cache_service = CacheService(request.app.state.redis)
+    
+    cached = await cache_service.get_admin_dashboard(name)
+    if cached is None:
+        async with _dashboard_locks.setdefault(name, asyncio.Lock()):
+            cached = await cache_service.get_admin_dashboard(name)
+            if cached is None:
+                cached = orjson.dumps(await compute())
+                await cache_service.cache_admin_dashboard(name, cached, DASHBOARD_CACHE_TTL)
+    return Response(cached, media_type="application/json")
+
+
+async def _invalidate_dashboards(request: Request):
+    """Drop cached dashboards after a moderation action changes their counts"""
+    await CacheService(request.app.state.redis).invalidate_admin_dashboards()
+
+
+@router.get("/analytics", response_class=ORJSONResponse)
 async def get_analytics(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    request: Request
 ):
     """Get platform analytics"""
-    # User stats
-    total_users_result = await db.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar()
-    
-    registered_users_result = await db.execute(
-        select(func.count(User.id)).where(User.is_anonymous == False)
-    )
-    registered_users = registered_users_result.scalar()
-    
-    # Recent activity (last 7 days)
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    
-    new_users_result = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= week_ago)
-    )
-    new_users_week = new_users_result.scalar()
-    
-    # Circle stats
-    total_circles_result = await db.execute(select(func.count(Circle.id)))
-    total_circles = total_circles_result.scalar()
-    
-    # Post stats
-    total_posts_result = await db.execute(select(func.count(Post.id)))
-    total_posts = total_posts_result.scalar()
-    
-    flagged_posts_result = await db.execute(
-        select(func.count(Post.id)).where(Post.is_flagged == True)
+    return await _cached_dashboard(request, "analytics", _compute_analytics)
+
+
+async def _compute_analytics() -> Dict[str, Any]:
+    """Aggregate platform-wide analytics"""
+    # Recent activity (last 7 days), evaluated by Postgres
+    week_ago = utcnow() - timedelta(days=7)
+    
+    (
+        (total_users, registered_users, anonymous_users, new_users_week),
+        (total_circles,),
+        (total_posts, flagged_posts),
+        (total_paths,),
+        (active_enrollments,),
+        (total_moods, avg_mood_week),
+        (total_conversations,),
+    ) = await asyncio.gather(
+        # User stats
+        _one(select(
+            func.count(User.id),
+            func.count(User.id).filter(User.is_anonymous == False),
+            func.count(User.id).filter(User.is_anonymous == True),
+            func.count(User.id).filter(User.created_at >= week_ago)
+        )),
+        # Circle stats
+        _one(select(func.count(Circle.id))),
+        # Post stats
+        _one(select(
+            func.count(Post.id),
+            func.count(Post.id).filter(Post.is_flagged == True)
+        )),
+        # Path stats
+        _one(select(func.count(Path.id))),
+        _one(
+            select(func.count(UserPathProgress.id)).where(
+                UserPathProgress.is_completed == False
+            )
+        ),
+        # Mood tracking stats
+        _one(select(
+            func.count(MoodEntry.id),
+            func.avg(MoodEntry.mood_score).filter(MoodEntry.created_at >= week_ago)
+        )),
+        # Conversation stats
+        _one(select(func.count(Conversation.id))),
     )
-    flagged_posts = flagged_posts_result.scalar()
-    
-    # Path stats
-    total_paths_result = await db.execute(select(func.count(Path.id)))
-    total_paths = total_paths_result.scalar()
-    
-    active_enrollments_result = await db.execute(
-        select(func.count(UserPathProgress.id)).where(
-            UserPathProgress.is_completed == False
-        )
-    )
-    active_enrollments = active_enrollments_result.scalar()
-    
-    # Mood tracking stats
-    total_moods_result = await db.execute(select(func.count(MoodEntry.id)))
-    total_moods = total_moods_result.scalar()
-    
-    avg_mood_result = await db.execute(
-        select(func.avg(MoodEntry.mood_score)).where(
-            MoodEntry.created_at >= week_ago
-        )
-    )
-    avg_mood_week = avg_mood_result.scalar() or 0
-    
-    # Conversation stats
-    total_conversations_result = await db.execute(select(func.count(Conversation.id)))
-    total_conversations = total_conversations_result.scalar()
+    avg_mood_week = avg_mood_week or 0
     
     return {
         "users": {
             "total": total_users,
             "registered": registered_users,
-            "anonymous": total_users - registered_users,
+            "anonymous": anonymous_users,
             "new_this_week": new_users_week
         },
         "circles": {
@@ -192,55 +300,55 @@ async def get_analytics(
 
 # Phase 3: User Management & Risk Assessment
 
+# Flagged post counts per user, joined into list_all_users so the page is
+# one round-trip
+_flag_counts = (
+    select(Post.user_id, func.count(Post.id).label("flag_count"))
+    .where(Post.is_flagged == True)
+    .group_by(Post.user_id)
+    .subquery()
+)
+
+
 @router.get("/users")
 async def list_all_users(
     search: str = None,
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """List all users with optional search"""
-    query = select(User)
-    
-    if search:
-        query = query.where(
-            (User.username.ilike(f"%{search}%")) | 
-            (User.id.cast(String).ilike(f"%{search}%"))
+    # Plain columns, not entities: rows go straight to orjson as dicts
+    query = lambda_stmt(lambda: (
+        select(
+            User.id, User.username, User.email, User.role, User.is_active,
+            User.is_admin, User.is_moderator, User.is_anonymous,
+            User.risk_level, User.escalation_status, User.created_at,
+            func.coalesce(_flag_counts.c.flag_count, 0).label("flag_count")
         )
+        .outerjoin(_flag_counts, _flag_counts.c.user_id == User.id)
+    ))
     
-    query = query.order_by(User.created_at.desc()).offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    users = result.scalars().all()
+    if search:
+        # Substring match on username is served by the trigram index; ids
+        # only match exactly, so the primary key is used instead of a cast
+        pattern = f"%{search}%"
+        try:
+            search_id = UUID(search)
+        except ValueError:
+            query += lambda s: s.where(User.username.ilike(pattern))
+        else:
+            query += lambda s: s.where(
+                (User.username.ilike(pattern)) | (User.id == search_id)
+            )
+    
+    query += lambda s: s.order_by(User.created_at.desc()).offset(skip).limit(limit)
+    
+    result = await db.stream(
+        query, execution_options={"yield_per": STREAM_BATCH_SIZE}
+    )
     
-    # Get flag counts for each user
-    from app.db.models.post import Post
-    user_data = []
-    for user in users:
-        # Count flagged posts by this user
-        flag_result = await db.execute(
-            select(func.count(Post.id))
-            .where(Post.user_id == user.id, Post.is_flagged == True)
-        )
-        flag_count = flag_result.scalar() or 0
-        
-        user_data.append({
-            "id": str(user.id),
-            "username": user.username,
-            "email": user.email,
-            "role": user.role,
-            "is_active": user.is_active,
-            "is_admin": user.is_admin,
-            "is_moderator": user.is_moderator,
-            "is_anonymous": user.is_anonymous,
-            "risk_level": user.risk_level,
-            "escalation_status": user.escalation_status,
-            "created_at": user.created_at.isoformat(),
-            "flag_count": flag_count
-        })
-    
-    return user_data
+    return ORJSONResponse([dict(row) async for row in result.mappings()])
 
 
 @router.get("/users/at-risk")
@@ -248,30 +356,31 @@ async def get_at_risk_users(
     risk_level: str = "high",  # medium, high, critical
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get list of users flagged for elevated risk"""
-    result = await db.execute(
-        select(User)
-        .where(User.risk_level.in_(['high', 'critical'] if risk_level == 'high' else [risk_level]))
+    levels = ELEVATED_RISK_LEVELS if risk_level == 'high' else (risk_level,)
+    rows = await db.stream(
+        select(
+            User.id, User.username, User.risk_level, User.escalation_status,
+            User.last_risk_assessment, User.is_anonymous,
+            func.count().over().label("total")
+        )
+        .where(User.risk_level.in_(levels))
         .order_by(User.last_risk_assessment.desc())
         .offset(skip)
         .limit(limit)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
     )
-    users = result.scalars().all()
-    
-    return [
-        {
-            "id": str(user.id),
-            "username": user.username,
-            "risk_level": user.risk_level,
-            "escalation_status": user.escalation_status,
-            "last_risk_assessment": user.last_risk_assessment.isoformat() if user.last_risk_assessment else None,
-            "is_anonymous": user.is_anonymous
-        }
-        for user in users
-    ]
+    
+    users = []
+    total = 0
+    async for row in rows.mappings():
+        user = dict(row)
+        total = user.pop("total")
+        users.append(user)
+    
+    return ORJSONResponse(users, headers={TOTAL_COUNT_HEADER: str(total)})
 
 
 @router.patch("/users/{user_id}/role")
@@ -288,103 +397,97 @@ async def update_user_role(
             detail="Admin access required"
         )
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    if not user:
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            role=role,
+            is_moderator=role == 'moderator',
+            is_peer_supporter=role in ['peer_supporter', 'moderator']
+        )
+        .returning(User.id)
+    )
+    if not result.first():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    user.role = role
-    user.is_moderator = role == 'moderator'
-    user.is_peer_supporter = role in ['peer_supporter', 'moderator']
-    
     await db.commit()
+    invalidate_cached_user(user_id)
     
     return {"message": f"User role updated to {role}"}
 
 
 @router.patch("/users/{user_id}/escalation")
 async def update_escalation_status(
+    request: Request,
     user_id: UUID,
     status_update: str,  # pending, escalated, resolved
     notes: str = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update user escalation status"""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    values = {"escalation_status": status_update}
+    if notes:
+        values["moderation_notes"] = notes
     
-    if not user:
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(**values)
+        .returning(User.id)
+    )
+    if not result.first():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    user.escalation_status = status_update
-    if notes:
-        user.moderation_notes = notes
-    
     await db.commit()
+    invalidate_cached_user(user_id)
+    await _invalidate_dashboards(request)
     
     return {"message": f"Escalation status updated to {status_update}"}
 
 
-@router.get("/moderation/summary")
+@router.get("/moderation/summary", response_class=ORJSONResponse)
 async def get_moderation_summary(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get summary of moderation queue"""
-    # Flagged posts by severity
-    critical_result = await db.execute(
-        select(func.count(Post.id)).where(
-            Post.is_flagged == True,
-            Post.flag_severity == 'critical'
-        )
-    )
-    critical_count = critical_result.scalar() or 0
-    
-    high_result = await db.execute(
-        select(func.count(Post.id)).where(
-            Post.is_flagged == True,
-            Post.flag_severity == 'high'
-        )
-    )
-    high_count = high_result.scalar() or 0
-    
-    medium_result = await db.execute(
-        select(func.count(Post.id)).where(
-            Post.is_flagged == True,
-            Post.flag_severity == 'medium'
-        )
+    return await _cached_dashboard(
+        request, "moderation_summary", lambda: _compute_moderation_summary(db)
     )
-    medium_count = medium_result.scalar() or 0
-    
-    low_result = await db.execute(
-        select(func.count(Post.id)).where(
-            Post.is_flagged == True,
-            Post.flag_severity == 'low'
-        )
-    )
-    low_count = low_result.scalar() or 0
-    
-    # At-risk users
-    high_risk_result = await db.execute(
-        select(func.count(User.id)).where(User.risk_level == 'high')
-    )
-    high_risk_count = high_risk_result.scalar() or 0
-    
-    critical_risk_result = await db.execute(
-        select(func.count(User.id)).where(User.risk_level == 'critical')
-    )
-    critical_risk_count = critical_risk_result.scalar() or 0
-    
-    # Pending escalations
-    pending_result = await db.execute(
-        select(func.count(User.id)).where(User.escalation_status == 'pending')
+
+
+async def _compute_moderation_summary(db: AsyncSession) -> Dict[str, Any]:
+    """Aggregate moderation queue counts"""
+    # Flagged posts by severity, with the total computed in the same scan
+    post_counts = select(
+        func.count(Post.id).filter(Post.flag_severity == 'critical').label("critical"),
+        func.count(Post.id).filter(Post.flag_severity == 'high').label("high"),
+        func.count(Post.id).filter(Post.flag_severity == 'medium').label("medium"),
+        func.count(Post.id).filter(Post.flag_severity == 'low').label("low"),
+        func.count(Post.id).label("total")
+    ).where(
+        Post.is_flagged == True,
+        Post.flag_severity.in_(FLAG_SEVERITIES)
+    ).cte("post_counts")
+    
+    # At-risk users and pending escalations
+    user_counts = select(
+        func.count(User.id).filter(User.risk_level == 'high').label("high_risk"),
+        func.count(User.id).filter(User.risk_level == 'critical').label("critical_risk"),
+        func.count(User.id).filter(User.escalation_status == 'pending').label("pending")
+    ).where(
+        User.risk_level.in_(ELEVATED_RISK_LEVELS) |
+        (User.escalation_status == 'pending')
+    ).cte("user_counts")
+    
+    # Both CTEs yield exactly one row, so the cross join is one row too
+    counts = (await db.execute(select(post_counts, user_counts))).one()
+    critical_count, high_count, medium_count, low_count, total_flagged = (
+        counts.critical, counts.high, counts.medium, counts.low, counts.total
     )
-    pending_count = pending_result.scalar() or 0
-    
-    # Calculate stats for SystemMonitoring page
-    total_flagged = critical_count + high_count + medium_count + low_count
+    high_risk_count = counts.high_risk
+    critical_risk_count = counts.critical_risk
+    pending_count = counts.pending
     
     return {
         "total_flagged_posts": total_flagged,
@@ -413,39 +516,34 @@ async def get_moderation_summary(
 async def list_all_paths(
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """List all paths for admin management"""
-    result = await db.execute(
-        select(Path)
+    rows = await db.stream(
+        select(
+            Path.id, Path.name, Path.category, Path.difficulty, Path.step_count,
+            Path.enrollment_count, Path.estimated_duration, Path.is_published,
+            Path.created_at
+        )
         .order_by(Path.created_at.desc())
         .offset(skip)
         .limit(limit)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
     )
-    paths = result.scalars().all()
-    
-    return [
-        {
-            "id": str(path.id),
-            "name": path.name,
-            "category": path.category,
-            "difficulty": path.difficulty,
-            "step_count": path.step_count,
-            "enrollment_count": path.enrollment_count,
-            "estimated_duration": path.estimated_duration,
-            "is_published": path.is_published,
-            "created_at": path.created_at.isoformat()
-        }
-        for path in paths
-    ]
+    
+    return ORJSONResponse([dict(row) async for row in rows.mappings()])
+
+
+async def _invalidate_path_catalog(request: Request):
+    """Drop cached list_paths pages after a path is created, edited or removed"""
+    await CacheService(request.app.state.redis).invalidate_path_catalog()
 
 
 @router.post("/paths")
 async def create_path(
+    request: Request,
     path_data: Dict[str, Any],
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new path"""
     new_path = Path(
@@ -462,6 +560,7 @@ async def create_path(
     db.add(new_path)
     await db.commit()
     await db.refresh(new_path)
+    await _invalidate_path_catalog(request)
     
     return {
         "id": str(new_path.id),
@@ -477,10 +576,10 @@ async def create_path(
 
 @router.patch("/paths/{path_id}")
 async def update_path(
+    request: Request,
     path_id: UUID,
     path_data: Dict[str, Any],
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a path"""
     result = await db.execute(select(Path).where(Path.id == path_id))
@@ -504,6 +603,7 @@ async def update_path(
     
     await db.commit()
     await db.refresh(path)
+    await _invalidate_path_catalog(request)
     
     return {
         "id": str(path.id),
@@ -517,9 +617,9 @@ async def update_path(
 
 @router.delete("/paths/{path_id}")
 async def delete_path(
+    request: Request,
     path_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(verify_admin)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a path"""
     result = await db.execute(select(Path).where(Path.id == path_id))
@@ -530,5 +630,6 @@ async def delete_path(
     
     await db.delete(path)
     await db.commit()
+    await _invalidate_path_catalog(request)
     
     return {"message": "Path deleted successfully"}
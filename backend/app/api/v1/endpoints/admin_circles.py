@@ -1,23 +1,24 @@
 """Admin endpoints for circle management"""
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import List
 from uuid import UUID
+import uuid
 
 from app.db.session import get_db
 from app.db.models.user import User
 from app.db.models.circle import Circle, CircleMembership
 from app.schemas.circle import CircleCreate, CircleResponse
 from app.api.deps import get_current_user
-
-router = APIRouter()
+from app.api.v1.endpoints.admin import STREAM_BATCH_SIZE
 
 
 async def require_moderator(current_user: User = Depends(get_current_user)):
     """Verify user is a moderator or admin"""
-    if not (current_user.is_moderator or current_user.is_admin):
+    if not current_user.is_staff:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Moderator access required"
@@ -25,6 +26,9 @@ async def require_moderator(current_user: User = Depends(get_current_user)):
     return current_user
 
 
+router = APIRouter(dependencies=[Depends(require_moderator)])
+
+
 @router.post("/circles", response_model=CircleResponse, status_code=status.HTTP_201_CREATED)
 async def create_circle(
     circle: CircleCreate,
@@ -32,15 +36,16 @@ async def create_circle(
     current_user: User = Depends(require_moderator)
 ):
     """Create a new circle (moderator only)"""
-    # Create circle
+    # Create circle with a client-side id so the membership can reference it
+    # without a flush; both rows go out with the commit
     new_circle = Circle(
+        id=uuid.uuid4(),
         name=circle.name,
         topic=circle.topic,
         description=circle.description,
-        icon=circle.icon
+        icon=circle.icon,
+        member_count=1
     )
-    db.add(new_circle)
-    await db.flush()
     
     # Auto-join creator as moderator
     membership = CircleMembership(
@@ -48,11 +53,11 @@ async def create_circle(
         user_id=current_user.id,
         is_moderator=True
     )
-    db.add(membership)
-    new_circle.member_count = 1
+    db.add_all([new_circle, membership])
     
+    # Column defaults are applied in Python at flush and sessions don't
+    # expire on commit, so the response needs no refresh
     await db.commit()
-    await db.refresh(new_circle)
     
     return new_circle
 
@@ -61,8 +66,7 @@ async def create_circle(
 async def update_circle(
     circle_id: UUID,
     circle_update: CircleCreate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_moderator)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update circle details (moderator only)"""
     result = await db.execute(select(Circle).where(Circle.id == circle_id))
@@ -87,8 +91,7 @@ async def update_circle(
 @router.delete("/circles/{circle_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_circle(
     circle_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_moderator)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a circle (moderator only)"""
     result = await db.execute(select(Circle).where(Circle.id == circle_id))
@@ -103,25 +106,22 @@ async def delete_circle(
 
 @router.get("/circles/stats", response_model=List[dict])
 async def get_circle_stats(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_moderator)
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get statistics for all circles"""
-    result = await db.execute(
-        select(Circle)
-        .order_by(Circle.member_count.desc())
+    """Get statistics for circles, largest first"""
+    rows = await db.stream(
+        select(
+            Circle.id, Circle.name, Circle.topic, Circle.member_count,
+            Circle.post_count, Circle.created_at
+        )
+        .order_by(Circle.member_count.desc(), Circle.id)
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
     )
-    circles = result.scalars().all()
-    
-    stats = []
-    for circle in circles:
-        stats.append({
-            "id": str(circle.id),
-            "name": circle.name,
-            "topic": circle.topic,
-            "member_count": circle.member_count,
-            "post_count": circle.post_count,
-            "created_at": circle.created_at.isoformat()
-        })
     
-    return stats
+    # orjson encodes UUID/datetime natively; skip response_model validation
+    # and jsonable_encoder
+    return ORJSONResponse([dict(row) async for row in rows.mappings()])
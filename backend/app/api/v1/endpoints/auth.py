@@ -3,10 +3,11 @@
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import uuid
+from sqlalchemy import select, or_
+import secrets
 
 from app.db.session import get_db
+from app.db.base import utcnow
 from app.db.models.user import User
 from app.schemas.user import (
     UserCreate,
@@ -16,11 +17,13 @@ from app.schemas.user import (
     AnonymousSessionCreate
 )
 from app.core.security import (
-    verify_password,
+    verify_and_update_password,
     get_password_hash,
     create_access_token,
-    decode_access_token
+    decode_access_token,
+    run_password_task
 )
+from app.api.deps import invalidate_cached_user
 
 
 router = APIRouter()
@@ -33,8 +36,9 @@ async def create_anonymous_session(
 ):
     """Create anonymous session without registration"""
     
-    # Generate anonymous username
-    anonymous_id = str(uuid.uuid4())[:8]
+    # Generate anonymous username; 64 random bits keep collisions against the
+    # unique username index negligible without building a UUID just to slice it
+    anonymous_id = secrets.token_hex(8)
     username = f"anonymous_{anonymous_id}"
     
     # Create anonymous user
@@ -45,9 +49,10 @@ async def create_anonymous_session(
         privacy_consent_date=datetime.utcnow() if data.privacy_consent else None
     )
     
+    # All defaults are Python-side and sessions don't expire on commit, so
+    # the user needs no refresh before building the response
     db.add(user)
     await db.commit()
-    await db.refresh(user)
     
     # Create access token
     access_token = create_access_token(data={"sub": str(user.id)})
@@ -65,60 +70,70 @@ async def register(
 ):
     """Register new user account"""
     
-    # Check if converting from anonymous
-    existing_user = None
+    # Anonymous account being converted (if any), plus username and email
+    # uniqueness, fetched in one query and classified below
+    anonymous_user_id = None
     if user_data.anonymous_token:
         payload = decode_access_token(user_data.anonymous_token)
         if payload:
-            user_id = payload.get("sub")
-            result = await db.execute(select(User).where(User.id == user_id))
-            existing_user = result.scalar_one_or_none()
-            
-            if existing_user and not existing_user.is_anonymous:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="User is already registered"
-                )
+            anonymous_user_id = payload.get("sub")
     
-    # Check username uniqueness
-    result = await db.execute(
-        select(User).where(User.username == user_data.username)
+    conditions = [User.username == user_data.username]
+    if user_data.email:
+        conditions.append(User.email == user_data.email)
+    if anonymous_user_id:
+        conditions.append(User.id == anonymous_user_id)
+    
+    result = await db.execute(select(User).where(or_(*conditions)))
+    matches = result.scalars().all()
+    
+    existing_user = next(
+        (u for u in matches if anonymous_user_id and str(u.id) == anonymous_user_id),
+        None
     )
-    if result.scalar_one_or_none():
+    if existing_user and not existing_user.is_anonymous:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User is already registered"
+        )
+    
+    # Check username uniqueness
+    if any(u.username == user_data.username for u in matches):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already exists"
         )
     
     # Check email uniqueness if provided
-    if user_data.email:
-        result = await db.execute(
-            select(User).where(User.email == user_data.email)
+    if user_data.email and any(u.email == user_data.email for u in matches):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
         )
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+    
+    # bcrypt is CPU-bound; keep it off the event loop
+    hashed_password = None
+    if user_data.password:
+        hashed_password = await run_password_task(get_password_hash, user_data.password)
     
     if existing_user:
         # Convert anonymous user to registered
         existing_user.username = user_data.username
         existing_user.email = user_data.email
-        existing_user.hashed_password = get_password_hash(user_data.password) if user_data.password else None
+        existing_user.hashed_password = hashed_password
         existing_user.is_anonymous = False
         existing_user.privacy_consent = user_data.privacy_consent
         existing_user.privacy_consent_date = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(existing_user)
+        invalidate_cached_user(existing_user.id)
         user = existing_user
     else:
         # Create new user
         user = User(
             username=user_data.username,
             email=user_data.email,
-            hashed_password=get_password_hash(user_data.password) if user_data.password else None,
+            hashed_password=hashed_password,
             is_anonymous=False,
             privacy_consent=user_data.privacy_consent,
             privacy_consent_date=datetime.utcnow() if user_data.privacy_consent else None
@@ -126,7 +141,6 @@ async def register(
         
         db.add(user)
         await db.commit()
-        await db.refresh(user)
     
     # Create access token
     access_token = create_access_token(data={"sub": str(user.id)})
@@ -165,15 +179,28 @@ async def login(
             detail="Anonymous users cannot login. Please register first."
         )
     
-    # Verify password
-    if not user.hashed_password or not verify_password(login_data.password, user.hashed_password):
+    # Verify password (in a worker thread; bcrypt is CPU-bound)
+    if not user.hashed_password:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username/email or password"
+        )
+    valid, new_hash = await run_password_task(
+        verify_and_update_password, login_data.password, user.hashed_password
+    )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username/email or password"
         )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
+    # Upgrade hashes made with an older cost; rides on the last_login write
+    if new_hash:
+        user.hashed_password = new_hash
+    
+    # Update last login; stamped by the database clock and rendered inline in
+    # the UPDATE (the response doesn't read it back)
+    user.last_login = utcnow()
     await db.commit()
     
     # Create access token
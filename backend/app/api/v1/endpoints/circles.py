@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, update, delete, func, and_, exists, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import raiseload
 from typing import List
 from uuid import UUID
 
 from app.db.session import get_db
+from app.db.base import utcnow
 from app.db.models.user import User
 from app.db.models.circle import Circle, CircleMembership
 from app.db.models.post import Post
@@ -19,6 +22,22 @@ from app.api.deps import get_current_user
 router = APIRouter()
 
 
+def _circle_with_membership(circle: Circle, membership) -> CircleWithMembershipResponse:
+    """Build a circle response directly from loaded rows (no re-validation)"""
+    return CircleWithMembershipResponse.model_construct(
+        id=circle.id,
+        name=circle.name,
+        topic=circle.topic,
+        description=circle.description,
+        icon=circle.icon,
+        member_count=circle.member_count,
+        post_count=circle.post_count,
+        created_at=circle.created_at,
+        is_member=membership is not None,
+        is_moderator=membership.is_moderator if membership else False
+    )
+
+
 @router.get("", response_model=List[CircleWithMembershipResponse])
 async def list_circles(
     skip: int = 0,
@@ -27,32 +46,26 @@ async def list_circles(
     current_user: User = Depends(get_current_user)
 ):
     """List all circles with user's membership status"""
-    # Get circles
+    # Circles with the caller's membership (if any) joined in
     result = await db.execute(
-        select(Circle)
-        .order_by(Circle.member_count.desc())
+        select(Circle, CircleMembership)
+        .outerjoin(
+            CircleMembership,
+            and_(
+                CircleMembership.circle_id == Circle.id,
+                CircleMembership.user_id == current_user.id
+            )
+        )
+        .options(raiseload('*'))
+        .order_by(Circle.member_count.desc(), Circle.id)
         .offset(skip)
         .limit(limit)
     )
-    circles = result.scalars().all()
-    
-    # Get user's memberships
-    membership_result = await db.execute(
-        select(CircleMembership)
-        .where(CircleMembership.user_id == current_user.id)
-    )
-    memberships = {m.circle_id: m for m in membership_result.scalars().all()}
     
-    # Build response
-    response = []
-    for circle in circles:
-        circle_dict = CircleResponse.model_validate(circle).model_dump()
-        membership = memberships.get(circle.id)
-        circle_dict["is_member"] = membership is not None
-        circle_dict["is_moderator"] = membership.is_moderator if membership else False
-        response.append(CircleWithMembershipResponse(**circle_dict))
-    
-    return response
+    return [
+        _circle_with_membership(circle, membership)
+        for circle, membership in result.all()
+    ]
 
 
 @router.post("", response_model=CircleResponse, status_code=status.HTTP_201_CREATED)
@@ -64,9 +77,9 @@ async def create_circle(
     """Create a new circle (creator becomes moderator)"""
     # Check if circle with same name exists
     result = await db.execute(
-        select(Circle).where(Circle.name == circle_data.name)
+        select(exists().where(Circle.name == circle_data.name))
     )
-    if result.scalar_one_or_none():
+    if result.scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Circle with this name already exists"
@@ -99,28 +112,22 @@ async def get_circle(
 ):
     """Get circle details with user's membership status"""
     result = await db.execute(
-        select(Circle).where(Circle.id == circle_id)
-    )
-    circle = result.scalar_one_or_none()
-    if not circle:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
-    
-    # Check membership
-    membership_result = await db.execute(
-        select(CircleMembership).where(
+        select(Circle, CircleMembership)
+        .outerjoin(
+            CircleMembership,
             and_(
-                CircleMembership.circle_id == circle_id,
+                CircleMembership.circle_id == Circle.id,
                 CircleMembership.user_id == current_user.id
             )
         )
+        .options(raiseload('*'))
+        .where(Circle.id == circle_id)
     )
-    membership = membership_result.scalar_one_or_none()
-    
-    circle_dict = CircleResponse.model_validate(circle).model_dump()
-    circle_dict["is_member"] = membership is not None
-    circle_dict["is_moderator"] = membership.is_moderator if membership else False
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     
-    return CircleWithMembershipResponse(**circle_dict)
+    return _circle_with_membership(*row)
 
 
 @router.post("/{circle_id}/join", status_code=status.HTTP_204_NO_CONTENT)
@@ -130,31 +137,37 @@ async def join_circle(
     current_user: User = Depends(get_current_user)
 ):
     """Join a circle"""
-    # Check circle exists
-    result = await db.execute(select(Circle).where(Circle.id == circle_id))
-    circle = result.scalar_one_or_none()
-    if not circle:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
-    
-    # Check not already member
-    membership_result = await db.execute(
-        select(CircleMembership).where(
-            and_(
-                CircleMembership.circle_id == circle_id,
-                CircleMembership.user_id == current_user.id
-            )
+    # Insert the membership and bump the count in one statement: selecting
+    # the circle makes a missing circle insert nothing, ON CONFLICT makes a
+    # repeated (or concurrent) join a no-op, and the UPDATE only touches the
+    # circle if a row was inserted
+    joined = (
+        insert(CircleMembership)
+        .from_select(
+            ["user_id", "circle_id"],
+            select(literal(current_user.id), Circle.id).where(Circle.id == circle_id)
         )
+        .on_conflict_do_nothing(index_elements=["circle_id", "user_id"])
+        .returning(CircleMembership.circle_id)
+        .cte("joined")
     )
-    if membership_result.scalar_one_or_none():
+    result = await db.execute(
+        update(Circle)
+        .where(Circle.id.in_(select(joined.c.circle_id)))
+        # Set explicitly: with a DML CTE attached, SQLAlchemy skips the
+        # column's Python onupdate and would bind NULL
+        .values(member_count=Circle.member_count + 1, updated_at=utcnow())
+        .returning(Circle.id)
+    )
+    if not result.first():
+        circle_result = await db.execute(select(exists().where(Circle.id == circle_id)))
+        if not circle_result.scalar():
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already a member"
         )
     
-    # Join
-    membership = CircleMembership(user_id=current_user.id, circle_id=circle_id)
-    circle.member_count += 1
-    db.add(membership)
     await db.commit()
 
 
@@ -165,29 +178,33 @@ async def leave_circle(
     current_user: User = Depends(get_current_user)
 ):
     """Leave a circle"""
-    # Get membership
-    result = await db.execute(
-        select(CircleMembership).where(
+    # Delete the membership and decrement the count in one statement: the
+    # UPDATE only touches the circle if the DELETE removed a row
+    removed = (
+        delete(CircleMembership)
+        .where(
             and_(
                 CircleMembership.circle_id == circle_id,
                 CircleMembership.user_id == current_user.id
             )
         )
+        .returning(CircleMembership.circle_id)
+        .cte("removed")
     )
-    membership = result.scalar_one_or_none()
-    if not membership:
+    result = await db.execute(
+        update(Circle)
+        .where(Circle.id.in_(select(removed.c.circle_id)))
+        # Set explicitly: with a DML CTE attached, SQLAlchemy skips the
+        # column's Python onupdate and would bind NULL
+        .values(member_count=func.greatest(Circle.member_count - 1, 0), updated_at=utcnow())
+        .returning(Circle.id)
+    )
+    if not result.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Not a member"
         )
     
-    # Update circle count
-    circle_result = await db.execute(select(Circle).where(Circle.id == circle_id))
-    circle = circle_result.scalar_one()
-    circle.member_count = max(0, circle.member_count - 1)
-    
-    # Delete membership
-    await db.delete(membership)
     await db.commit()
 
 
@@ -202,14 +219,14 @@ async def list_circle_members(
     """List circle members (requires membership)"""
     # Check circle exists and user is member
     membership_check = await db.execute(
-        select(CircleMembership).where(
+        select(exists().where(
             and_(
                 CircleMembership.circle_id == circle_id,
                 CircleMembership.user_id == current_user.id
             )
-        )
+        ))
     )
-    if not membership_check.scalar_one_or_none():
+    if not membership_check.scalar():
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Must be a member to view members"
@@ -3,12 +3,12 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, update, func, desc, true
 from uuid import UUID
 
 from app.db.session import get_db
 from app.db.models.user import User
-from app.db.models.conversation import Conversation, Message
+from app.db.models.conversation import Conversation, ConversationMode, Message
 from app.schemas.conversation import (
     ConversationCreate,
     ConversationResponse,
@@ -32,13 +32,14 @@ async def create_conversation(
     
     conversation = Conversation(
         user_id=current_user.id,
-        mode=data.mode,
+        mode=ConversationMode(data.mode),
         title=data.title
     )
     
+    # Defaults are applied in Python at flush and sessions don't expire on
+    # commit, so no refresh is needed to build the response
     db.add(conversation)
     await db.commit()
-    await db.refresh(conversation)
     
     return ConversationResponse(
         id=conversation.id,
@@ -57,42 +58,49 @@ async def list_conversations(
 ):
     """List user's conversations"""
     
+    # Message count and last message as correlated subqueries, so the whole
+    # list is one statement (both served by ix_messages_conversation_created)
+    message_count = (
+        select(func.count(Message.id))
+        .where(Message.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    last_message = (
+        select(Message.content)
+        .where(Message.conversation_id == Conversation.id)
+        .order_by(desc(Message.created_at))
+        .limit(1)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    
     result = await db.execute(
-        select(Conversation)
+        select(
+            Conversation.id,
+            Conversation.mode,
+            Conversation.title,
+            Conversation.started_at,
+            Conversation.is_active,
+            message_count.label("message_count"),
+            last_message.label("last_message")
+        )
         .where(Conversation.user_id == current_user.id)
         .order_by(desc(Conversation.started_at))
     )
-    conversations = result.scalars().all()
-    
-    response = []
-    for conv in conversations:
-        # Get message count
-        count_result = await db.execute(
-            select(func.count(Message.id))
-            .where(Message.conversation_id == conv.id)
-        )
-        message_count = count_result.scalar() or 0
-        
-        # Get last message
-        last_msg_result = await db.execute(
-            select(Message.content)
-            .where(Message.conversation_id == conv.id)
-            .order_by(desc(Message.created_at))
-            .limit(1)
+    
+    return [
+        ConversationResponse(
+            id=row.id,
+            mode=row.mode.value,
+            title=row.title,
+            started_at=row.started_at,
+            is_active=row.is_active,
+            message_count=row.message_count,
+            last_message=row.last_message
         )
-        last_message = last_msg_result.scalar_one_or_none()
-        
-        response.append(ConversationResponse(
-            id=conv.id,
-            mode=conv.mode.value,
-            title=conv.title,
-            started_at=conv.started_at,
-            is_active=conv.is_active,
-            message_count=message_count,
-            last_message=last_message
-        ))
-    
-    return response
+        for row in result.all()
+    ]
 
 
 @router.get("/{conversation_id}/messages", response_model=List[MessageResponse])
@@ -105,41 +113,55 @@ async def get_conversation_messages(
 ):
     """Get messages from a conversation"""
     
-    # Verify conversation belongs to user
+    # Ownership check and the message page in one round trip: the page is a
+    # LATERAL subquery outer-joined to the owned conversation, so no row at
+    # all means not found and a single all-NULL row means an empty page
+    page = (
+        select(
+            Message.id,
+            Message.role,
+            Message.content,
+            Message.sentiment_score,
+            Message.emotion_tags,
+            Message.created_at
+        )
+        .where(Message.conversation_id == Conversation.id)
+        .order_by(Message.created_at)
+        .limit(limit)
+        .offset(offset)
+        .correlate(Conversation)
+        .lateral("page")
+    )
     result = await db.execute(
-        select(Conversation).where(
+        select(page)
+        .select_from(Conversation)
+        .outerjoin(page, true())
+        .where(
             Conversation.id == conversation_id,
             Conversation.user_id == current_user.id
         )
+        .order_by(page.c.created_at)
     )
-    conversation = result.scalar_one_or_none()
+    rows = result.all()
     
-    if not conversation:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Conversation not found"
         )
     
-    # Get messages
-    result = await db.execute(
-        select(Message)
-        .where(Message.conversation_id == conversation_id)
-        .order_by(Message.created_at)
-        .limit(limit)
-        .offset(offset)
-    )
-    messages = result.scalars().all()
-    
+    # Values are already typed by the DB layer; skip re-validation
     return [
-        MessageResponse(
-            id=msg.id,
-            role=msg.role.value,
-            content=msg.content,
-            sentiment_score=msg.sentiment_score,
-            emotion_tags=msg.emotion_tags or [],
-            created_at=msg.created_at
+        MessageResponse.model_construct(
+            id=row.id,
+            role=row.role.value,
+            content=row.content,
+            sentiment_score=row.sentiment_score,
+            emotion_tags=row.emotion_tags or [],
+            created_at=row.created_at
         )
-        for msg in messages
+        for row in rows
+        if row.id is not None
     ]
 
 
@@ -152,20 +174,21 @@ async def delete_conversation(
     """Soft delete a conversation"""
     
     result = await db.execute(
-        select(Conversation).where(
+        update(Conversation)
+        .where(
             Conversation.id == conversation_id,
             Conversation.user_id == current_user.id
         )
+        .values(is_active=False)
+        .returning(Conversation.id)
     )
-    conversation = result.scalar_one_or_none()
     
-    if not conversation:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Conversation not found"
         )
     
-    conversation.is_active = False
     await db.commit()
     
     return None
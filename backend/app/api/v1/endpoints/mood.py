@@ -1,13 +1,17 @@
 """Mood tracking endpoints"""
 
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
-from statistics import mean
+from pydantic import TypeAdapter
+from sqlalchemy import select, func, desc, cast, Date, Integer
+from sqlalchemy.dialects.postgresql import insert
+from decimal import Decimal
+import uuid
 
 from app.db.session import get_db
+from app.db.base import utcnow
 from app.db.models.user import User
 from app.db.models.mood import MoodEntry
 from app.db.models.milestone import UserMilestone
@@ -17,6 +21,8 @@ from app.api.deps import get_current_user
 
 router = APIRouter()
 
+_MOOD_ENTRY_LIST_ADAPTER = TypeAdapter(List[MoodEntryResponse])
+
 
 @router.post("", response_model=MoodEntryResponse, status_code=status.HTTP_201_CREATED)
 async def create_mood_entry(
@@ -35,12 +41,15 @@ async def create_mood_entry(
         conversation_id=data.conversation_id
     )
     
+    # Flush so the milestone counts see the entry, then commit both in one
+    # transaction. Defaults are applied in Python at flush and sessions don't
+    # expire on commit, so no refresh is needed to build the response.
     db.add(entry)
-    await db.commit()
-    await db.refresh(entry)
+    await db.flush()
     
     # Check for milestones
     await _check_mood_milestones(current_user.id, db)
+    await db.commit()
     
     return MoodEntryResponse.model_validate(entry)
 
@@ -48,6 +57,7 @@ async def create_mood_entry(
 @router.get("/history", response_model=MoodHistoryResponse)
 async def get_mood_history(
     days: int = 7,
+    limit: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -59,19 +69,36 @@ async def get_mood_history(
             detail="Days must be between 1 and 90"
         )
     
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    cutoff_date = utcnow() - timedelta(days=days)
     
-    result = await db.execute(
-        select(MoodEntry)
-        .where(
-            MoodEntry.user_id == current_user.id,
-            MoodEntry.created_at >= cutoff_date
+    in_window = (
+        MoodEntry.user_id == current_user.id,
+        MoodEntry.created_at >= cutoff_date
+    )
+    
+    # Average and trend in SQL. The trend compares the newer half of the
+    # entries (row_num <= total / 2) against the older half.
+    numbered = (
+        select(
+            MoodEntry.mood_score,
+            func.row_number().over(order_by=desc(MoodEntry.created_at)).label("row_num"),
+            func.count().over().label("total")
         )
-        .order_by(desc(MoodEntry.created_at))
+        .where(*in_window)
+        .subquery()
     )
-    entries = result.scalars().all()
+    first_half = numbered.c.row_num <= numbered.c.total / 2
+    stats = (await db.execute(
+        select(
+            func.count(),
+            func.avg(numbered.c.mood_score),
+            func.avg(numbered.c.mood_score).filter(first_half),
+            func.avg(numbered.c.mood_score).filter(~first_half)
+        )
+    )).one()
+    total_entries, average_score, first_half_avg, second_half_avg = stats
     
-    if not entries:
+    if not total_entries:
         return MoodHistoryResponse(
             entries=[],
             average_score=0.0,
@@ -79,108 +106,100 @@ async def get_mood_history(
             total_entries=0
         )
     
-    # Calculate average
-    scores = [entry.mood_score for entry in entries]
-    average_score = mean(scores)
-    
     # Calculate trend (compare first half to second half)
-    mid_point = len(scores) // 2
-    if mid_point > 0:
-        first_half_avg = mean(scores[:mid_point])
-        second_half_avg = mean(scores[mid_point:])
-        
-        if second_half_avg > first_half_avg + 0.5:
+    if first_half_avg is not None:
+        if second_half_avg > first_half_avg + Decimal("0.5"):
             trend = "improving"
-        elif second_half_avg < first_half_avg - 0.5:
+        elif second_half_avg < first_half_avg - Decimal("0.5"):
             trend = "declining"
         else:
             trend = "stable"
     else:
         trend = "stable"
     
+    # Only the returned page of entries comes over the wire
+    query = (
+        select(MoodEntry)
+        .where(*in_window)
+        .order_by(desc(MoodEntry.created_at))
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    
     return MoodHistoryResponse(
-        entries=[MoodEntryResponse.model_validate(e) for e in entries],
-        average_score=round(average_score, 2),
+        entries=_MOOD_ENTRY_LIST_ADAPTER.validate_python(result.scalars().all(), from_attributes=True),
+        average_score=round(float(average_score), 2),
         trend=trend,
-        total_entries=len(entries)
+        total_entries=total_entries
     )
 
 
-async def _check_mood_milestones(user_id, db: AsyncSession):
-    """Check and award mood-related milestones"""
-    
-    # Check for first check-in milestone
-    result = await db.execute(
-        select(func.count(MoodEntry.id))
-        .where(MoodEntry.user_id == user_id)
-    )
-    entry_count = result.scalar()
-    
-    if entry_count == 1:
-        # Award first check-in milestone
-        existing = await db.execute(
-            select(UserMilestone).where(
-                UserMilestone.user_id == user_id,
-                UserMilestone.milestone_type == "first_checkin"
-            )
-        )
-        if not existing.scalar_one_or_none():
-            milestone = UserMilestone(
-                user_id=user_id,
-                milestone_type="first_checkin"
-            )
-            db.add(milestone)
-    
-    # Check for streak milestones
-    # Get last 7 days of entries
-    cutoff = datetime.utcnow() - timedelta(days=7)
-    result = await db.execute(
-        select(func.date(MoodEntry.created_at))
+def mood_streak_query(user_id, window_days: int):
+    """
+    Scalar subquery for the user's current check-in streak (consecutive days
+    ending today), looking back at most window_days
+    """
+    today = cast(utcnow(), Date)
+    
+    # Distinct check-in days in the window, numbered newest first
+    days = (
+        select(func.date(MoodEntry.created_at).label("day"))
         .where(
             MoodEntry.user_id == user_id,
-            MoodEntry.created_at >= cutoff
+            MoodEntry.created_at >= utcnow() - timedelta(days=window_days)
         )
         .distinct()
-        .order_by(desc(func.date(MoodEntry.created_at)))
+        .subquery()
+    )
+    ranked = select(
+        days.c.day,
+        func.row_number().over(order_by=days.c.day.desc()).label("rn")
+    ).subquery()
+    
+    # The streak is the run of days matching today, today-1, ...; after the
+    # first gap no later (older) day can line up again
+    return (
+        select(func.count())
+        .select_from(ranked)
+        .where(ranked.c.day == today - (cast(ranked.c.rn, Integer) - 1))
+        .scalar_subquery()
+    )
+
+
+async def _check_mood_milestones(user_id, db: AsyncSession):
+    """Check and award mood-related milestones (caller commits)"""
+    streak_query = mood_streak_query(user_id, 7)
+    entry_count_query = (
+        select(func.count(MoodEntry.id))
+        .where(MoodEntry.user_id == user_id)
+        .scalar_subquery()
     )
-    dates = [row[0] for row in result.fetchall()]
-    
-    # Calculate consecutive days
-    streak = 0
-    current_date = datetime.utcnow().date()
-    for date in dates:
-        if date == current_date - timedelta(days=streak):
-            streak += 1
-        else:
-            break
     
-    # Award streak milestones
-    if streak >= 3:
-        existing = await db.execute(
-            select(UserMilestone).where(
-                UserMilestone.user_id == user_id,
-                UserMilestone.milestone_type == "three_day_streak"
-            )
-        )
-        if not existing.scalar_one_or_none():
-            milestone = UserMilestone(
-                user_id=user_id,
-                milestone_type="three_day_streak"
-            )
-            db.add(milestone)
+    entry_count, streak = (
+        await db.execute(select(entry_count_query, streak_query))
+    ).one()
     
+    earned = []
+    if entry_count == 1:
+        earned.append("first_checkin")
+    if streak >= 3:
+        earned.append("three_day_streak")
     if streak >= 7:
-        existing = await db.execute(
-            select(UserMilestone).where(
-                UserMilestone.user_id == user_id,
-                UserMilestone.milestone_type == "week_streak"
-            )
+        earned.append("week_streak")
+    
+    # Already-awarded milestones are skipped by the unique index
+    if earned:
+        await db.execute(
+            insert(UserMilestone)
+            .values([
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "milestone_type": milestone_type,
+                    "earned_at": datetime.utcnow()
+                }
+                for milestone_type in earned
+            ])
+            .on_conflict_do_nothing(index_elements=["user_id", "milestone_type"])
         )
-        if not existing.scalar_one_or_none():
-            milestone = UserMilestone(
-                user_id=user_id,
-                milestone_type="week_streak"
-            )
-            db.add(milestone)
-    
-    await db.commit()
@@ -1,100 +1,134 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_, or_, case, cast, func, literal, exists, tuple_, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import selectinload
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
+import orjson
 
 from app.db.session import get_db
-from app.db.models.user import User
+from app.db.base import utcnow
 from app.db.models.path import Path, PathStep, UserPathProgress
 from app.schemas.path import (
     PathResponse,
     PathDetailResponse,
-    PathStepResponse,
     UserPathProgressResponse,
     PathProgressUpdate,
     StepReflectionCreate
 )
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user_id
+from app.services.cache_service import CacheService
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 
 router = APIRouter()
 
+PATH_CATALOG_CACHE_TTL = 60  # seconds
+
 
 @router.get("", response_model=List[PathResponse])
 async def list_paths(
+    request: Request,
     category: str = None,
     difficulty: str = None,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 20,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """List all available paths"""
-    query = select(Path)
-    
-    if category:
-        query = query.where(Path.category == category)
-    if difficulty:
-        query = query.where(Path.difficulty == difficulty)
+    """
+    List all available paths
     
-    query = query.order_by(Path.enrollment_count.desc()).offset(skip).limit(limit)
+    Pages are cached in Redis as encoded JSON, shared by all users, and sent
+    as-is on a hit
+    """
+    cache_service = CacheService(request.app.state.redis)
+    page = f"{category}:{difficulty}:{cursor}:{limit}"
     
-    result = await db.execute(query)
-    paths = result.scalars().all()
+    cached = await cache_service.get_path_catalog_page(page)
+    if cached is not None:
+        payload, next_cursor = cached
+    else:
+        # Only the PathResponse columns; rows are encoded as-is
+        query = select(
+            Path.id, Path.name, Path.category, Path.difficulty, Path.estimated_duration,
+            Path.step_count, Path.enrollment_count, Path.created_at
+        )
+        
+        if category:
+            query = query.where(Path.category == category)
+        if difficulty:
+            query = query.where(Path.difficulty == difficulty)
+        # Keyset pagination on (enrollment_count, id), see ix_paths_enrollment_count
+        if cursor:
+            query = query.where(
+                tuple_(Path.enrollment_count, Path.id) < decode_cursor(cursor, int, UUID)
+            )
+        
+        query = query.order_by(Path.enrollment_count.desc(), Path.id.desc()).limit(limit + 1)
+        
+        result = await db.execute(query)
+        paths = result.mappings().all()
+        
+        next_cursor = None
+        if len(paths) > limit:
+            paths = paths[:limit]
+            next_cursor = encode_cursor(paths[-1]["enrollment_count"], paths[-1]["id"])
+        
+        payload = orjson.dumps([dict(row) for row in paths])
+        await cache_service.cache_path_catalog_page(
+            page, payload, next_cursor, PATH_CATALOG_CACHE_TTL
+        )
     
-    return paths
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return Response(payload, media_type="application/json", headers=headers)
 
 
 @router.get("/{path_id}", response_model=PathDetailResponse)
 async def get_path_detail(
     path_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Get path details with steps and user progress"""
-    # Get path with steps
+    # Path with the caller's progress (if enrolled) in one query; steps come
+    # ordered by the relationship
     result = await db.execute(
-        select(Path)
+        select(Path, UserPathProgress)
+        .outerjoin(
+            UserPathProgress,
+            and_(
+                UserPathProgress.path_id == Path.id,
+                UserPathProgress.user_id == current_user_id
+            )
+        )
         .options(selectinload(Path.steps))
         .where(Path.id == path_id)
     )
-    path = result.scalar_one_or_none()
-    if not path:
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Path not found")
+    path, user_progress = row
     
-    # Get user progress if enrolled
-    progress_result = await db.execute(
-        select(UserPathProgress).where(
-            and_(
-                UserPathProgress.path_id == path_id,
-                UserPathProgress.user_id == current_user.id
-            )
-        )
+    # One validation pass straight from the ORM objects (Path.user_progress is
+    # every user's progress, so the path's fields are picked explicitly)
+    return PathDetailResponse.model_validate(
+        {
+            **{name: getattr(path, name) for name in PathResponse.model_fields},
+            "steps": path.steps,
+            "user_progress": user_progress
+        },
+        from_attributes=True
     )
-    user_progress = progress_result.scalar_one_or_none()
-    
-    # Build response
-    path_dict = PathResponse.model_validate(path).model_dump()
-    
-    # Sort steps by order
-    steps = sorted(path.steps, key=lambda s: s.order_index)
-    path_dict["steps"] = [PathStepResponse.model_validate(s) for s in steps]
-    
-    if user_progress:
-        path_dict["user_progress"] = UserPathProgressResponse.model_validate(user_progress)
-    else:
-        path_dict["user_progress"] = None
-    
-    return PathDetailResponse(**path_dict)
 
 
 @router.post("/{path_id}/enroll", response_model=UserPathProgressResponse, status_code=status.HTTP_201_CREATED)
 async def enroll_in_path(
+    request: Request,
     path_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Enroll in a path"""
     # Check path exists
@@ -105,14 +139,14 @@ async def enroll_in_path(
     
     # Check not already enrolled
     progress_result = await db.execute(
-        select(UserPathProgress).where(
+        select(exists().where(
             and_(
                 UserPathProgress.path_id == path_id,
-                UserPathProgress.user_id == current_user.id
+                UserPathProgress.user_id == current_user_id
             )
-        )
+        ))
     )
-    if progress_result.scalar_one_or_none():
+    if progress_result.scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already enrolled in this path"
@@ -120,7 +154,7 @@ async def enroll_in_path(
     
     # Create progress record
     progress = UserPathProgress(
-        user_id=current_user.id,
+        user_id=current_user_id,
         path_id=path_id,
         current_step_index=0,
         completed_steps={},
@@ -128,10 +162,11 @@ async def enroll_in_path(
     )
     db.add(progress)
     
-    # Update enrollment count
+    # Update enrollment count (reorders the catalog)
     path.enrollment_count += 1
     
     await db.commit()
+    await CacheService(request.app.state.redis).invalidate_path_catalog()
     await db.refresh(progress)
     
     return progress
@@ -142,50 +177,83 @@ async def update_progress(
     path_id: UUID,
     update_data: PathProgressUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Update path progress"""
-    # Get progress record
+    # Completed-step count: taken from the request when new steps are sent,
+    # otherwise counted in SQL from the stored JSONB (object or legacy array)
+    if update_data.completed_steps:
+        completed_count = literal(len(update_data.completed_steps))
+    else:
+        stored = UserPathProgress.completed_steps
+        completed_count = case(
+            (
+                func.jsonb_typeof(stored) == "object",
+                select(func.count()).select_from(func.jsonb_object_keys(stored)).scalar_subquery()
+            ),
+            else_=func.jsonb_array_length(stored)
+        )
+    has_steps = Path.step_count > 0
+    now_completed = and_(has_steps, completed_count >= Path.step_count)
+    
+    values = {
+        "current_step_index": update_data.current_step_index,
+        "progress_percentage": case(
+            (has_steps, completed_count * 100.0 / Path.step_count),
+            else_=UserPathProgress.progress_percentage
+        ),
+        "is_completed": or_(UserPathProgress.is_completed, now_completed),
+        "completed_at": case((now_completed, utcnow()), else_=UserPathProgress.completed_at),
+    }
+    if update_data.completed_steps:
+        values["completed_steps"] = update_data.completed_steps
+    
+    # One UPDATE ... FROM paths: the step count is joined in rather than
+    # fetched, and the new state comes back via RETURNING
     result = await db.execute(
-        select(UserPathProgress).where(
+        update(UserPathProgress)
+        .where(
             and_(
                 UserPathProgress.path_id == path_id,
-                UserPathProgress.user_id == current_user.id
+                UserPathProgress.user_id == current_user_id,
+                Path.id == UserPathProgress.path_id
             )
         )
+        .values(**values)
+        .returning(
+            UserPathProgress.id,
+            UserPathProgress.path_id,
+            UserPathProgress.current_step_index,
+            UserPathProgress.progress_percentage,
+            UserPathProgress.is_completed,
+            UserPathProgress.started_at,
+            UserPathProgress.completed_at,
+            UserPathProgress.last_accessed_at.label("last_activity")
+        )
     )
-    progress = result.scalar_one_or_none()
+    progress = result.mappings().first()
     if not progress:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not enrolled in this path"
         )
     
-    # Get path to check step count
-    path_result = await db.execute(select(Path).where(Path.id == path_id))
-    path = path_result.scalar_one()
-    
-    # Update progress
-    progress.current_step_index = update_data.current_step_index
-    progress.last_activity = datetime.utcnow()
-    
-    if update_data.completed_steps:
-        progress.completed_steps = update_data.completed_steps
-    
-    # Calculate progress percentage
-    if path.step_count > 0:
-        completed_count = len(progress.completed_steps or {})
-        progress.progress_percentage = (completed_count / path.step_count) * 100
-        
-        # Check if completed
-        if completed_count >= path.step_count:
-            progress.is_completed = True
-            progress.completed_at = datetime.utcnow()
-    
     await db.commit()
-    await db.refresh(progress)
     
-    return progress
+    return UserPathProgressResponse.model_construct(**progress)
+
+
+def _set_jsonb_key(column, key: str, value):
+    """
+    jsonb_set expression writing one top-level key of a JSONB object column.
+    Legacy rows default to an empty array, so anything but an object starts
+    from {}
+    """
+    target = case(
+        (func.jsonb_typeof(column) == "object", column),
+        else_=cast({}, JSONB)
+    )
+    return func.jsonb_set(target, literal([key], ARRAY(Text)), cast(value, JSONB), True)
 
 
 @router.post("/{path_id}/reflections", status_code=status.HTTP_204_NO_CONTENT)
@@ -193,43 +261,40 @@ async def save_step_reflection(
     path_id: UUID,
     reflection_data: StepReflectionCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Save reflection for a step"""
-    # Get progress record
+    # Write just this step's keys server-side with jsonb_set: no read of the
+    # progress row, no rewrite of the whole blob, and concurrent reflections
+    # on different steps don't overwrite each other
+    step_key = str(reflection_data.step_id)
+    now = datetime.utcnow().isoformat()
+    
     result = await db.execute(
-        select(UserPathProgress).where(
+        update(UserPathProgress)
+        .where(
             and_(
                 UserPathProgress.path_id == path_id,
-                UserPathProgress.user_id == current_user.id
+                UserPathProgress.user_id == current_user_id
             )
         )
+        .values(
+            reflection_logs=_set_jsonb_key(UserPathProgress.reflection_logs, step_key, {
+                "reflection": reflection_data.reflection,
+                "mood_rating": reflection_data.mood_rating,
+                "timestamp": now
+            }),
+            # Mark step as completed
+            completed_steps=_set_jsonb_key(UserPathProgress.completed_steps, step_key, {
+                "completed_at": now
+            })
+        )
+        .returning(UserPathProgress.id)
     )
-    progress = result.scalar_one_or_none()
-    if not progress:
+    if not result.first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not enrolled in this path"
         )
     
-    # Add reflection to logs
-    if not progress.reflection_logs:
-        progress.reflection_logs = {}
-    
-    progress.reflection_logs[str(reflection_data.step_id)] = {
-        "reflection": reflection_data.reflection,
-        "mood_rating": reflection_data.mood_rating,
-        "timestamp": datetime.utcnow().isoformat()
-    }
-    
-    # Mark step as completed
-    if not progress.completed_steps:
-        progress.completed_steps = {}
-    
-    progress.completed_steps[str(reflection_data.step_id)] = {
-        "completed_at": datetime.utcnow().isoformat()
-    }
-    
-    progress.last_activity = datetime.utcnow()
-    
     await db.commit()
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
-from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import select, update, delete, and_, func, exists, tuple_, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload, load_only
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 from app.db.session import get_db
-from app.db.models.user import User
+from app.db.base import utcnow
 from app.db.models.post import Post, PostReaction
 from app.db.models.circle import Circle, CircleMembership
 from app.schemas.post import (
@@ -17,100 +20,124 @@ from app.schemas.post import (
     PostReactionCreate,
     PostFlagRequest
 )
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user_id
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 
 router = APIRouter()
 
+_POST_PAGE_ADAPTER = TypeAdapter(List[PostWithRepliesResponse])
+
+# Columns PostResponse reads; moderation and audit columns stay unloaded
+_POST_RESPONSE_COLUMNS = (
+    Post.id,
+    Post.circle_id,
+    Post.user_id,
+    Post.parent_id,
+    Post.content,
+    Post.is_anonymous,
+    Post.reaction_count,
+    Post.reply_count,
+    Post.is_flagged,
+    Post.is_hidden,
+    Post.created_at,
+)
+
+
+def _is_member(circle_id, user_id):
+    """EXISTS clause for the user's membership in a circle (circle_id may be a column)"""
+    return exists().where(
+        and_(
+            CircleMembership.circle_id == circle_id,
+            CircleMembership.user_id == user_id
+        )
+    )
+
+
+async def _get_post_for_member(db: AsyncSession, post_id: UUID, user_id: UUID, detail: str) -> Post:
+    """Fetch a post and check membership of its circle in one query"""
+    result = await db.execute(
+        select(Post, _is_member(Post.circle_id, user_id).label("is_member"))
+        .where(Post.id == post_id)
+    )
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+    if not row.is_member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return row.Post
+
 
 @router.get("/circles/{circle_id}/posts", response_model=List[PostWithRepliesResponse])
 async def list_circle_posts(
     circle_id: UUID,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 20,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """List posts in a circle (requires membership)"""
-    # Check membership
-    membership_result = await db.execute(
-        select(CircleMembership).where(
-            and_(
-                CircleMembership.circle_id == circle_id,
-                CircleMembership.user_id == current_user.id
-            )
-        )
-    )
-    if not membership_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Must be a member to view posts"
-        )
-    
-    # Get posts (top-level only, not replies)
-    result = await db.execute(
+    # Top-level posts with their visible replies and the caller's reaction,
+    # each child collection batched into one IN (...) query by selectinload.
+    # Membership is checked in the same statement
+    query = (
         select(Post)
         .where(
             and_(
                 Post.circle_id == circle_id,
                 Post.parent_id.is_(None),
-                Post.is_hidden == False
+                Post.is_hidden == False,
+                _is_member(circle_id, current_user_id)
             )
         )
-        .order_by(Post.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+        .options(
+            load_only(*_POST_RESPONSE_COLUMNS),
+            selectinload(Post.replies.and_(Post.is_hidden == False)).load_only(*_POST_RESPONSE_COLUMNS),
+            selectinload(
+                Post.reactions.and_(PostReaction.user_id == current_user_id)
+            ).load_only(PostReaction.reaction_type)
+        )
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(limit + 1)
     )
+    # Keyset pagination: seek past the last post of the previous page
+    # (ix_posts_circle_top_level_visible) instead of scanning an OFFSET
+    if cursor:
+        query = query.where(
+            tuple_(Post.created_at, Post.id) < decode_cursor(cursor, datetime.fromisoformat, UUID)
+        )
+    
+    result = await db.execute(query)
     posts = result.scalars().all()
     
-    # Get user's reactions
-    post_ids = [p.id for p in posts]
-    reactions_result = await db.execute(
-        select(PostReaction).where(
-            and_(
-                PostReaction.post_id.in_(post_ids),
-                PostReaction.user_id == current_user.id
+    # An empty page is either the end of the feed or a non-member
+    if not posts:
+        membership_result = await db.execute(select(_is_member(circle_id, current_user_id)))
+        if not membership_result.scalar():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Must be a member to view posts"
             )
-        )
-    )
-    user_reactions = {r.post_id: r.reaction_type for r in reactions_result.scalars().all()}
     
-    # Get replies for each post
-    replies_result = await db.execute(
-        select(Post).where(
-            and_(
-                Post.parent_id.in_(post_ids),
-                Post.is_hidden == False
-            )
-        )
-        .order_by(Post.created_at)
-    )
-    all_replies = replies_result.scalars().all()
-    
-    # Group replies by parent
-    replies_by_parent = {}
-    for reply in all_replies:
-        if reply.parent_id not in replies_by_parent:
-            replies_by_parent[reply.parent_id] = []
-        replies_by_parent[reply.parent_id].append(reply)
+    # The extra row only signals that another page exists
+    headers = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(posts[-1].created_at, posts[-1].id)}
     
-    # Build response
-    response = []
-    for post in posts:
-        post_dict = PostResponse.model_validate(post).model_dump()
-        post_dict["author_name"] = "Anonymous" if post.is_anonymous else f"User {post.user_id}"
-        
-        # Add replies
-        replies = []
-        for reply in replies_by_parent.get(post.id, []):
-            reply_dict = PostResponse.model_validate(reply).model_dump()
-            reply_dict["author_name"] = "Anonymous" if reply.is_anonymous else f"User {reply.user_id}"
-            replies.append(PostResponse(**reply_dict))
-        
-        post_dict["replies"] = replies
-        post_dict["user_reaction"] = user_reactions.get(post.id)
-        response.append(PostWithRepliesResponse(**post_dict))
+    # One compiled validator call for the whole page; replies validate from
+    # the loaded collection and author names are derived by PostResponse
+    post_responses = _POST_PAGE_ADAPTER.validate_python(posts, from_attributes=True)
+    for post, post_response in zip(posts, post_responses):
+        if post.reactions:
+            post_response.user_reaction = post.reactions[0].reaction_type
     
-    return response
+    # Serialize the validated page directly to JSON bytes rather than letting
+    # the response_model re-validate and re-encode it
+    return Response(
+        _POST_PAGE_ADAPTER.dump_json(post_responses),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.post("/circles/{circle_id}/posts", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
@@ -118,19 +145,23 @@ async def create_post(
     circle_id: UUID,
     post_data: PostCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Create a post in a circle (requires membership)"""
-    # Check membership
-    membership_result = await db.execute(
-        select(CircleMembership).where(
+    # Bump the circle's post count only if the caller is a member; no row
+    # back means not a member
+    circle_result = await db.execute(
+        update(Circle)
+        .where(
             and_(
-                CircleMembership.circle_id == circle_id,
-                CircleMembership.user_id == current_user.id
+                Circle.id == circle_id,
+                _is_member(circle_id, current_user_id)
             )
         )
+        .values(post_count=Circle.post_count + 1)
+        .returning(Circle.id)
     )
-    if not membership_result.scalar_one_or_none():
+    if not circle_result.first():
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Must be a member to post"
@@ -139,23 +170,16 @@ async def create_post(
     # Create post
     post = Post(
         circle_id=circle_id,
-        user_id=current_user.id,
+        user_id=current_user_id,
         content=post_data.content,
         is_anonymous=post_data.is_anonymous
     )
     db.add(post)
     
-    # Update circle post count
-    circle_result = await db.execute(select(Circle).where(Circle.id == circle_id))
-    circle = circle_result.scalar_one()
-    circle.post_count += 1
-    
+    # Defaults are applied in Python at flush, so no refresh is needed
     await db.commit()
-    await db.refresh(post)
     
-    response_dict = PostResponse.model_validate(post).model_dump()
-    response_dict["author_name"] = "Anonymous" if post.is_anonymous else f"User {post.user_id}"
-    return PostResponse(**response_dict)
+    return PostResponse.model_validate(post)
 
 
 @router.post("/posts/{post_id}/reply", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
@@ -163,49 +187,32 @@ async def reply_to_post(
     post_id: UUID,
     reply_data: PostReply,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Reply to a post"""
-    # Get parent post
-    parent_result = await db.execute(select(Post).where(Post.id == post_id))
-    parent = parent_result.scalar_one_or_none()
-    if not parent:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-    
-    # Check membership in circle
-    membership_result = await db.execute(
-        select(CircleMembership).where(
-            and_(
-                CircleMembership.circle_id == parent.circle_id,
-                CircleMembership.user_id == current_user.id
-            )
-        )
-    )
-    if not membership_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Must be a member to reply"
-        )
+    parent = await _get_post_for_member(db, post_id, current_user_id, "Must be a member to reply")
     
     # Create reply
     reply = Post(
         circle_id=parent.circle_id,
-        user_id=current_user.id,
+        user_id=current_user_id,
         parent_id=post_id,
         content=reply_data.content,
         is_anonymous=reply_data.is_anonymous
     )
     db.add(reply)
     
-    # Update parent reply count
-    parent.reply_count += 1
+    # Update parent reply count atomically; a Python increment would write
+    # back a stale count under concurrent replies
+    await db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(reply_count=Post.reply_count + 1)
+    )
     
     await db.commit()
-    await db.refresh(reply)
     
-    response_dict = PostResponse.model_validate(reply).model_dump()
-    response_dict["author_name"] = "Anonymous" if reply.is_anonymous else f"User {reply.user_id}"
-    return PostResponse(**response_dict)
+    return PostResponse.model_validate(reply)
 
 
 @router.post("/posts/{post_id}/reactions", status_code=status.HTTP_204_NO_CONTENT)
@@ -213,54 +220,34 @@ async def add_reaction(
     post_id: UUID,
     reaction_data: PostReactionCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Add or update reaction to a post"""
-    # Get post
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if not post:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-    
-    # Check membership
-    membership_result = await db.execute(
-        select(CircleMembership).where(
-            and_(
-                CircleMembership.circle_id == post.circle_id,
-                CircleMembership.user_id == current_user.id
-            )
-        )
-    )
-    if not membership_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Must be a member to react"
-        )
-    
-    # Check if reaction exists
-    reaction_result = await db.execute(
-        select(PostReaction).where(
-            and_(
-                PostReaction.post_id == post_id,
-                PostReaction.user_id == current_user.id
-            )
-        )
-    )
-    existing = reaction_result.scalar_one_or_none()
+    await _get_post_for_member(db, post_id, current_user_id, "Must be a member to react")
     
-    if existing:
-        # Update reaction type
-        if existing.reaction_type != reaction_data.reaction_type:
-            existing.reaction_type = reaction_data.reaction_type
-    else:
-        # Create new reaction
-        reaction = PostReaction(
+    # Upsert the reaction and bump the post's count in one statement; xmax is
+    # 0 only for a freshly inserted row, so changing a reaction doesn't count
+    upserted = (
+        insert(PostReaction)
+        .values(
             post_id=post_id,
-            user_id=current_user.id,
+            user_id=current_user_id,
             reaction_type=reaction_data.reaction_type
         )
-        db.add(reaction)
-        post.reaction_count += 1
+        .on_conflict_do_update(
+            index_elements=["post_id", "user_id"],
+            set_={"reaction_type": reaction_data.reaction_type}
+        )
+        .returning(PostReaction.post_id, literal_column("xmax = 0").label("inserted"))
+        .cte("upserted")
+    )
+    await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(upserted.c.post_id).where(upserted.c.inserted)))
+        # Set explicitly: with a DML CTE attached, SQLAlchemy skips the
+        # column's Python onupdate and would bind NULL
+        .values(reaction_count=Post.reaction_count + 1, updated_at=utcnow())
+    )
     
     await db.commit()
 
@@ -269,31 +256,36 @@ async def add_reaction(
 async def remove_reaction(
     post_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Remove reaction from a post"""
-    # Get reaction
-    result = await db.execute(
-        select(PostReaction).where(
+    # Delete the reaction and decrement the count in one statement: the
+    # UPDATE only touches the post if the DELETE removed a row
+    removed = (
+        delete(PostReaction)
+        .where(
             and_(
                 PostReaction.post_id == post_id,
-                PostReaction.user_id == current_user.id
+                PostReaction.user_id == current_user_id
             )
         )
+        .returning(PostReaction.post_id)
+        .cte("removed")
     )
-    reaction = result.scalar_one_or_none()
-    if not reaction:
+    result = await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(removed.c.post_id)))
+        # Set explicitly: with a DML CTE attached, SQLAlchemy skips the
+        # column's Python onupdate and would bind NULL
+        .values(reaction_count=func.greatest(Post.reaction_count - 1, 0), updated_at=utcnow())
+        .returning(Post.id)
+    )
+    if not result.first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reaction not found"
         )
     
-    # Update post count
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one()
-    post.reaction_count = max(0, post.reaction_count - 1)
-    
-    await db.delete(reaction)
     await db.commit()
 
 
@@ -302,29 +294,10 @@ async def flag_post(
     post_id: UUID,
     flag_data: PostFlagRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Flag a post for moderation"""
-    # Get post
-    result = await db.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
-    if not post:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-    
-    # Check membership
-    membership_result = await db.execute(
-        select(CircleMembership).where(
-            and_(
-                CircleMembership.circle_id == post.circle_id,
-                CircleMembership.user_id == current_user.id
-            )
-        )
-    )
-    if not membership_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Must be a member to flag posts"
-        )
+    post = await _get_post_for_member(db, post_id, current_user_id, "Must be a member to flag posts")
     
     # Flag post
     post.is_flagged = True
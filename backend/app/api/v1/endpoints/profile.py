@@ -1,9 +1,12 @@
 """Profile endpoints"""
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from pydantic import TypeAdapter
+from sqlalchemy import select, func, exists, cast
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 
 from app.db.session import get_db
 from app.db.models.user import User
@@ -12,11 +15,14 @@ from app.db.models.conversation import Conversation
 from app.db.models.milestone import UserMilestone
 from app.schemas.profile import ProfileResponse, MilestoneResponse
 from app.schemas.user import UserUpdate
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_cached_user
+from app.api.v1.endpoints.mood import mood_streak_query
 
 
 router = APIRouter()
 
+_MILESTONE_LIST_ADAPTER = TypeAdapter(List[MilestoneResponse])
+
 
 @router.get("", response_model=ProfileResponse)
 async def get_profile(
@@ -25,40 +31,19 @@ async def get_profile(
 ):
     """Get user profile with stats"""
     
-    # Calculate streak
-    streak_days = await _calculate_streak(current_user.id, db)
-    
-    # Get total mood entries
-    result = await db.execute(
-        select(func.count(MoodEntry.id))
-        .where(MoodEntry.user_id == current_user.id)
-    )
-    total_mood_entries = result.scalar()
-    
-    # Get total conversations
-    result = await db.execute(
-        select(func.count(Conversation.id))
-        .where(Conversation.user_id == current_user.id)
-    )
-    total_conversations = result.scalar()
-    
-    # Get milestones
-    result = await db.execute(
-        select(UserMilestone)
-        .where(UserMilestone.user_id == current_user.id)
-        .order_by(UserMilestone.earned_at.desc())
-    )
-    milestones = result.scalars().all()
+    # Streak, totals and milestones in one round trip
+    stats = await _profile_stats(current_user.id, db)
+    milestones = _MILESTONE_LIST_ADAPTER.validate_python(stats.milestones)
     
     return ProfileResponse(
         id=current_user.id,
         username=current_user.username,
         created_at=current_user.created_at,
-        streak_days=streak_days,
-        total_mood_entries=total_mood_entries,
-        total_conversations=total_conversations,
+        streak_days=stats.streak_days,
+        total_mood_entries=stats.total_mood_entries,
+        total_conversations=stats.total_conversations,
         milestone_count=len(milestones),
-        milestones=[MilestoneResponse.model_validate(m) for m in milestones],
+        milestones=milestones,
         is_admin=current_user.is_admin,
         is_anonymous=current_user.is_anonymous,
         role=current_user.role
@@ -76,9 +61,9 @@ async def update_profile(
     # Check username uniqueness if changing
     if data.username and data.username != current_user.username:
         result = await db.execute(
-            select(User).where(User.username == data.username)
+            select(exists().where(User.username == data.username))
         )
-        if result.scalar_one_or_none():
+        if result.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already exists"
@@ -88,9 +73,9 @@ async def update_profile(
     # Check email uniqueness if changing
     if data.email and data.email != current_user.email:
         result = await db.execute(
-            select(User).where(User.email == data.email)
+            select(exists().where(User.email == data.email))
         )
-        if result.scalar_one_or_none():
+        if result.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already exists"
@@ -99,6 +84,7 @@ async def update_profile(
     
     current_user.updated_at = datetime.utcnow()
     await db.commit()
+    invalidate_cached_user(current_user.id)
     await db.refresh(current_user)
     
     # Return updated profile
@@ -112,44 +98,48 @@ async def get_milestones(
 ):
     """Get all user milestones"""
     
+    # Only the response columns; values are already typed by the DB layer,
+    # so skip ORM hydration and re-validation
     result = await db.execute(
-        select(UserMilestone)
+        select(UserMilestone.id, UserMilestone.milestone_type, UserMilestone.earned_at)
         .where(UserMilestone.user_id == current_user.id)
         .order_by(UserMilestone.earned_at.desc())
     )
-    milestones = result.scalars().all()
     
-    return [MilestoneResponse.model_validate(m) for m in milestones]
+    return [MilestoneResponse.model_construct(**row) for row in result.mappings()]
 
 
-async def _calculate_streak(user_id, db: AsyncSession) -> int:
-    """Calculate current mood check-in streak"""
-    
-    # Get last 30 days of entries
-    cutoff = datetime.utcnow() - timedelta(days=30)
+async def _profile_stats(user_id, db: AsyncSession):
+    """
+    Current streak (last 30 days), mood/conversation totals and milestones
+    (newest first, as a JSONB array) in one query
+    """
+    milestones = func.jsonb_agg(
+        aggregate_order_by(
+            func.jsonb_build_object(
+                "id", UserMilestone.id,
+                "milestone_type", UserMilestone.milestone_type,
+                "earned_at", UserMilestone.earned_at
+            ),
+            UserMilestone.earned_at.desc()
+        ),
+        type_=JSONB
+    )
     result = await db.execute(
-        select(func.date(MoodEntry.created_at))
-        .where(
-            MoodEntry.user_id == user_id,
-            MoodEntry.created_at >= cutoff
+        select(
+            mood_streak_query(user_id, 30).label("streak_days"),
+            select(func.count(MoodEntry.id))
+            .where(MoodEntry.user_id == user_id)
+            .scalar_subquery()
+            .label("total_mood_entries"),
+            select(func.count(Conversation.id))
+            .where(Conversation.user_id == user_id)
+            .scalar_subquery()
+            .label("total_conversations"),
+            select(func.coalesce(milestones, cast([], JSONB)))
+            .where(UserMilestone.user_id == user_id)
+            .scalar_subquery()
+            .label("milestones")
         )
-        .distinct()
-        .order_by(func.date(MoodEntry.created_at).desc())
     )
-    dates = [row[0] for row in result.fetchall()]
-    
-    if not dates:
-        return 0
-    
-    # Calculate consecutive days from today
-    streak = 0
-    current_date = datetime.utcnow().date()
-    
-    for date in dates:
-        expected_date = current_date - timedelta(days=streak)
-        if date == expected_date:
-            streak += 1
-        else:
-            break
-    
-    return streak
+    return result.one()
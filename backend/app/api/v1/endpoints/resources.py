@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, and_, func
 from typing import List, Optional
 from uuid import UUID
 
 from app.db.session import get_db
-from app.db.models.user import User
 from app.db.models.resource import Resource
 from app.schemas.resource import ResourceResponse, ResourceFilter
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user_id
 
 router = APIRouter()
 
@@ -21,10 +21,16 @@ async def list_resources(
     skip: int = 0,
     limit: int = 20,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """List resources with optional filters"""
-    query = select(Resource)
+    # Only the ResourceResponse columns; rows are encoded as-is
+    query = select(
+        Resource.id, Resource.title, Resource.description, Resource.resource_type,
+        Resource.category, Resource.url, Resource.thumbnail_url, Resource.duration_minutes,
+        Resource.difficulty, Resource.tags, Resource.view_count, Resource.helpful_count,
+        Resource.created_at
+    )
     
     # Apply filters
     if resource_type:
@@ -41,20 +47,24 @@ async def list_resources(
     ).offset(skip).limit(limit)
     
     result = await db.execute(query)
-    resources = result.scalars().all()
     
-    return resources
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/{resource_id}", response_model=ResourceResponse)
 async def get_resource(
     resource_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Get resource details and increment view count"""
+    # Atomic increment that also returns the row: no read-modify-write race
+    # and no refresh
     result = await db.execute(
-        select(Resource).where(Resource.id == resource_id)
+        update(Resource)
+        .where(Resource.id == resource_id)
+        .values(view_count=Resource.view_count + 1)
+        .returning(Resource)
     )
     resource = result.scalar_one_or_none()
     if not resource:
@@ -63,10 +73,7 @@ async def get_resource(
             detail="Resource not found"
         )
     
-    # Increment view count
-    resource.view_count += 1
     await db.commit()
-    await db.refresh(resource)
     
     return resource
 
@@ -75,19 +82,19 @@ async def get_resource(
 async def mark_helpful(
     resource_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Mark a resource as helpful"""
     result = await db.execute(
-        select(Resource).where(Resource.id == resource_id)
+        update(Resource)
+        .where(Resource.id == resource_id)
+        .values(helpful_count=Resource.helpful_count + 1)
+        .returning(Resource.id)
     )
-    resource = result.scalar_one_or_none()
-    if not resource:
+    if not result.first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resource not found"
         )
     
-    # Increment helpful count
-    resource.helpful_count += 1
     await db.commit()
@@ -1,8 +1,11 @@
-from fastapi import APIRouter
-import random
+from fastapi import APIRouter, Response
+from datetime import datetime, time, timedelta
+import orjson
 
 router = APIRouter()
 
+DAILY_VERSE_MAX_AGE = 3600  # seconds
+
 # Curated verses for each mood category
 MOOD_VERSES = {
     "happy": [
@@ -161,25 +164,28 @@ MOOD_VERSES = {
 }
 
 
+# Encoded responses per mood, built once; handlers only pick one
+_VERSE_RESPONSES = {
+    mood_key: tuple(orjson.dumps({"mood": mood_key, **verse}) for verse in verses)
+    for mood_key, verses in MOOD_VERSES.items()
+}
+
+
 @router.get("/daily-verse")
 async def get_daily_verse(mood: str = "default"):
     """
     Get a scripture verse and devotional based on the user's mood.
-    Returns a random verse from the appropriate mood category.
+    Returns the verse of the day (UTC) for the appropriate mood category.
     """
-    # Normalize mood to lowercase and get verses
-    mood_key = mood.lower()
-    
-    # If mood not in our categories, use default
-    if mood_key not in MOOD_VERSES:
-        mood_key = "default"
+    # Normalize mood to lowercase; unknown moods use default
+    responses = _VERSE_RESPONSES.get(mood.lower()) or _VERSE_RESPONSES["default"]
     
-    verses = MOOD_VERSES[mood_key]
-    selected_verse = random.choice(verses)
+    # Same pick all day, so clients and proxies can cache it until rollover
+    now = datetime.utcnow()
+    until_tomorrow = int((datetime.combine(now.date() + timedelta(days=1), time.min) - now).total_seconds())
     
-    return {
-        "mood": mood_key,
-        "verse": selected_verse["verse"],
-        "reference": selected_verse["reference"],
-        "devotional": selected_verse["devotional"]
-    }
+    return Response(
+        responses[now.date().toordinal() % len(responses)],
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={min(DAILY_VERSE_MAX_AGE, until_tomorrow)}"}
+    )
@@ -2,17 +2,18 @@
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import json
+from sqlalchemy import select, and_
+import orjson
 from uuid import UUID
 from loguru import logger
 
 from app.db.session import AsyncSessionLocal
+from app.db.models.user import User
 from app.db.models.conversation import Conversation
-from app.api.deps import get_current_user_ws
+from app.api.deps import get_user_id_from_token
 from app.services.conversation_service import ConversationService
 from app.services.cache_service import CacheService
-from app.utils.websocket_manager import ws_manager
+from app.utils.websocket_manager import ws_manager, send_json
 
 
 router = APIRouter()
@@ -32,49 +33,55 @@ async def websocket_chat(
         conversation_id: Conversation UUID
     """
     
-    user = None
     user_id = None
     
     try:
-        # Create database session
-        async with AsyncSessionLocal() as db:
-            # Authenticate user
-            user = await get_current_user_ws(token, db)
-            
-            if not user:
-                await websocket.accept()
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Authentication failed"
-                })
-                await websocket.close(code=4001)
-                return
-            
-            user_id = str(user.id)
-            
-            # Verify conversation belongs to user
-            result = await db.execute(
-                select(Conversation).where(
-                    Conversation.id == UUID(conversation_id),
-                    Conversation.user_id == user.id
+        row = None
+        token_user_id = get_user_id_from_token(token)
+        
+        if token_user_id:
+            # Authenticate the user and load their conversation in one query
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(User.is_active, Conversation)
+                    .outerjoin(
+                        Conversation,
+                        and_(
+                            Conversation.user_id == User.id,
+                            Conversation.id == UUID(conversation_id)
+                        )
+                    )
+                    .where(User.id == token_user_id)
                 )
-            )
-            conversation = result.scalar_one_or_none()
-            
-            if not conversation:
-                await websocket.accept()
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Conversation not found"
-                })
-                await websocket.close(code=4004)
-                return
+                row = result.first()
+        
+        if row is None or not row.is_active:
+            await websocket.accept()
+            await send_json(websocket, {
+                "type": "error",
+                "message": "Authentication failed"
+            })
+            await websocket.close(code=4001)
+            return
+        
+        conversation = row.Conversation
+        
+        if not conversation:
+            await websocket.accept()
+            await send_json(websocket, {
+                "type": "error",
+                "message": "Conversation not found"
+            })
+            await websocket.close(code=4004)
+            return
+        
+        user_id = str(conversation.user_id)
         
         # Connect WebSocket
         await ws_manager.connect(websocket, user_id)
         
         # Send connection confirmation
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "connected",
             "message": f"Connected to Dala in {conversation.mode.value} mode",
             "conversation_id": conversation_id,
@@ -90,76 +97,84 @@ async def websocket_chat(
         # Mark user as active
         await cache_service.mark_user_active(user_id)
         
-        # Main message loop
-        while True:
-            # Receive message from client
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
-            
-            message_type = message_data.get("type", "message")
-            
-            if message_type == "message":
-                user_message = message_data.get("message", "")
-                mode = message_data.get("mode", conversation.mode.value)
+        # One session for the connection; its pooled connection is only
+        # checked out while a message's transaction is open
+        async with AsyncSessionLocal() as db:
+            # Main message loop
+            while True:
+                # Receive message from client
+                message_data = orjson.loads(await websocket.receive_text())
                 
-                if not user_message.strip():
-                    await websocket.send_json({
-                        "type": "error",
-                        "message": "Empty message"
+                message_type = message_data.get("type", "message")
+                
+                if message_type == "message":
+                    user_message = message_data.get("message", "")
+                    mode = message_data.get("mode", conversation.mode.value)
+                    
+                    if not user_message.strip():
+                        await send_json(websocket, {
+                            "type": "error",
+                            "message": "Empty message"
+                        })
+                        continue
+                    
+                    # Check rate limit and keep the user marked active
+                    is_allowed, remaining = await cache_service.check_rate_limit(
+                        user_id=user_id,
+                        endpoint="chat",
+                        limit=60,  # 60 messages per minute
+                        window=60,
+                        mark_active=True
+                    )
+                    
+                    if not is_allowed:
+                        ttl = await cache_service.get_rate_limit_ttl(user_id, "chat")
+                        await send_json(websocket, {
+                            "type": "error",
+                            "message": f"Rate limit exceeded. Please wait {ttl} seconds.",
+                            "retry_after": ttl
+                        })
+                        continue
+                    
+                    # Send typing indicator
+                    await send_json(websocket, {
+                        "type": "typing",
+                        "status": True
+                    })
+                    
+                    # Stream AI response
+                    try:
+                        async for chunk in conversation_service.stream_conversation(
+                            db=db,
+                            user_id=conversation.user_id,
+                            conversation_id=UUID(conversation_id),
+                            message=user_message,
+                            mode=mode
+                        ):
+                            await send_json(websocket, chunk)
+                    finally:
+                        # Discard anything left uncommitted and forget loaded rows,
+                        # so the next message starts clean on the same session
+                        await db.rollback()
+                        db.expunge_all()
+                    
+                    # Stop typing indicator
+                    await send_json(websocket, {
+                        "type": "typing",
+                        "status": False
                     })
-                    continue
                 
-                # Check rate limit
-                is_allowed, remaining = await cache_service.check_rate_limit(
-                    user_id=user_id,
-                    endpoint="chat",
-                    limit=60,  # 60 messages per minute
-                    window=60
-                )
+                elif message_type == "ping":
+                    # Keep-alive ping
+                    await send_json(websocket, {
+                        "type": "pong"
+                    })
                 
-                if not is_allowed:
-                    ttl = await cache_service.get_rate_limit_ttl(user_id, "chat")
-                    await websocket.send_json({
+                else:
+                    await send_json(websocket, {
                         "type": "error",
-                        "message": f"Rate limit exceeded. Please wait {ttl} seconds.",
-                        "retry_after": ttl
+                        "message": f"Unknown message type: {message_type}"
                     })
-                    continue
-                
-                # Send typing indicator
-                await websocket.send_json({
-                    "type": "typing",
-                    "status": True
-                })
-                
-                # Stream AI response
-                async with AsyncSessionLocal() as db:
-                    async for chunk in conversation_service.stream_conversation(
-                        db=db,
-                        user_id=user.id,
-                        conversation_id=UUID(conversation_id),
-                        message=user_message,
-                        mode=mode
-                    ):
-                        await websocket.send_json(chunk)
-                
-                # Stop typing indicator
-                await websocket.send_json({
-                    "type": "typing",
-                    "status": False
-                })
-                
-            elif message_type == "ping":
-                # Keep-alive ping
-                await websocket.send_json({
-                    "type": "pong"
-                })
-            
-            else:
-                await websocket.send_json({
-                    "type": "error",
-                    "message": f"Unknown message type: {message_type}"
-                })
     
     except WebSocketDisconnect:
         logger.info(f"User {user_id} disconnected")
@@ -169,7 +184,7 @@ async def websocket_chat(
     except Exception as e:
         logger.error(f"WebSocket error: {e}", exc_info=True)
         try:
-            await websocket.send_json({
+            await send_json(websocket, {
                 "type": "error",
                 "message": "An unexpected error occurred"
             })
@@ -29,6 +29,30 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
     
+    # Connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 5  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    # A ping costs a round-trip on every checkout; recycling already retires
+    # idle connections before server/LB timeouts. Enable on flaky networks.
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statements per connection
+    
+    # Optional read replica for read-only admin traffic (falls back to primary)
+    POSTGRES_READ_HOST: str = ""
+    POSTGRES_READ_PORT: str = ""
+    
+    @property
+    def READ_DATABASE_URL(self) -> str:
+        """Construct read replica database URL"""
+        host = self.POSTGRES_READ_HOST or self.POSTGRES_HOST
+        port = self.POSTGRES_READ_PORT or self.POSTGRES_PORT
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{host}:{port}/{self.POSTGRES_DB}"
+        )
+    
     @property
     def SYNC_DATABASE_URL(self) -> str:
         """Construct sync database URL for Alembic"""
@@ -50,6 +74,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+    BCRYPT_ROUNDS: int = 12  # existing hashes below this are upgraded on login
     
     # LLM APIs
     GROQ_API_KEY: str
@@ -69,6 +94,9 @@ class Settings(BaseSettings):
     # Sentiment Analysis
     SENTIMENT_MODEL: str = "j-hartmann/emotion-english-distilroberta-base"
     
+    # Risk Detection
+    RISK_DETECTION_HYPERSCAN: bool = True  # only used if the hyperscan package is installed
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,9 +1,29 @@
 """Advanced risk detection for user safety"""
 
+import functools
 import re
-from typing import Dict, List, Tuple
+import threading
+from bisect import bisect_right
+from typing import Callable, Dict, FrozenSet, List, Sequence, Set, Tuple
 from datetime import datetime
 
+from app.core.config import settings
+
+try:
+    import hyperscan
+except ImportError:  # optional; the re scanner below is used instead
+    hyperscan = None
+
+
+# Lower bounds of medium, high and critical; indexes _RISK_LEVELS via bisect
+_RISK_LEVEL_THRESHOLDS = (0.3, 0.6, 0.8)
+_RISK_LEVELS = (
+    ('low', False),
+    ('medium', False),
+    ('high', True),
+    ('critical', True),
+)
+
 
 class RiskDetector:
     """Detects mental health crisis indicators in user messages"""
@@ -52,61 +72,24 @@ class RiskDetector:
                 'requires_escalation': bool
             }
         """
-        content_lower = content.lower()
-        indicators = []
-        risk_score = 0.0
-        
-        # Check critical patterns (0.8-1.0)
-        for pattern, indicator_type in RiskDetector.CRITICAL_PATTERNS:
-            if re.search(pattern, content_lower):
-                indicators.append(indicator_type)
-                risk_score = max(risk_score, 0.9)
+        critical, high_risk, medium_risk, protective = _scan(content)
         
-        # Check high risk patterns (0.6-0.8)
-        for pattern, indicator_type in RiskDetector.HIGH_RISK_PATTERNS:
-            if re.search(pattern, content_lower):
-                indicators.append(indicator_type)
-                risk_score = max(risk_score, 0.7)
+        # Highest matched tier: critical 0.9, high 0.7, medium 0.4
+        risk_score = max(0.9 * bool(critical), 0.7 * bool(high_risk), 0.4 * bool(medium_risk))
         
-        # Check medium risk patterns (0.3-0.6)
-        for pattern, indicator_type in RiskDetector.MEDIUM_RISK_PATTERNS:
-            if re.search(pattern, content_lower):
-                indicators.append(indicator_type)
-                risk_score = max(risk_score, 0.4)
+        # Very negative sentiment increases risk
+        if sentiment_score is not None:
+            risk_score = min(1.0, risk_score + max(0.0, -sentiment_score) * 0.3)
         
-        # Factor in sentiment score if available
-        if sentiment_score is not None and sentiment_score < 0:
-            # Very negative sentiment increases risk
-            sentiment_factor = abs(sentiment_score) * 0.3
-            risk_score = min(1.0, risk_score + sentiment_factor)
+        # Protective factors reduce it
+        risk_score = max(0.0, risk_score - len(protective) * 0.1)
         
-        # Check for protective factors (reduce score)
-        protective_count = 0
-        for pattern, _ in RiskDetector.PROTECTIVE_PATTERNS:
-            if re.search(pattern, content_lower):
-                protective_count += 1
-        
-        if protective_count > 0:
-            risk_score = max(0.0, risk_score - (protective_count * 0.1))
-        
-        # Determine risk level
-        if risk_score >= 0.8:
-            risk_level = 'critical'
-            requires_escalation = True
-        elif risk_score >= 0.6:
-            risk_level = 'high'
-            requires_escalation = True
-        elif risk_score >= 0.3:
-            risk_level = 'medium'
-            requires_escalation = False
-        else:
-            risk_level = 'low'
-            requires_escalation = False
+        risk_level, requires_escalation = _RISK_LEVELS[bisect_right(_RISK_LEVEL_THRESHOLDS, risk_score)]
         
         return {
             'risk_score': round(risk_score, 2),
             'risk_level': risk_level,
-            'indicators': list(set(indicators)),  # Remove duplicates
+            'indicators': list(critical | high_risk | medium_risk),
             'requires_escalation': requires_escalation
         }
     
@@ -130,19 +113,16 @@ class RiskDetector:
         Determine if user's overall risk level should be updated
         
         Args:
-            user_risk_history: Recent risk scores for this user
+            user_risk_history: Recent risk scores for this user, oldest first
             current_score: Current message risk score
             threshold: Threshold for concern
             
         Returns:
             (should_update, new_risk_level)
         """
-        if not user_risk_history:
-            user_risk_history = []
-        
-        # Add current score
-        recent_scores = user_risk_history[-5:] + [current_score]
-        avg_score = sum(recent_scores) / len(recent_scores)
+        # Average of the last five scores plus the current one
+        recent_scores = (user_risk_history or [])[-5:]
+        avg_score = (sum(recent_scores) + current_score) / (len(recent_scores) + 1)
         
         # Determine user's overall risk level
         if current_score >= 0.8 or avg_score >= 0.7:
@@ -153,3 +133,119 @@ class RiskDetector:
             return True, 'medium'
         else:
             return False, 'low'
+
+
+# Pattern tiers in the order _scan_tiers returns their matches
+_TIERS = (
+    RiskDetector.CRITICAL_PATTERNS,
+    RiskDetector.HIGH_RISK_PATTERNS,
+    RiskDetector.MEDIUM_RISK_PATTERNS,
+    RiskDetector.PROTECTIVE_PATTERNS,
+)
+
+
+def _fuse(patterns: List[Tuple[str, str]]) -> re.Pattern:
+    """
+    Fuse (pattern, indicator) pairs into one case-insensitive regex, one
+    named group per indicator, so a tier is checked in a single scan.
+    
+    Each alternative sits in a lookahead so a match never consumes text;
+    otherwise a greedy pattern could swallow another indicator inside it.
+    """
+    return re.compile(
+        "|".join(f"(?=(?P<{indicator}>{pattern}))" for pattern, indicator in patterns),
+        re.IGNORECASE
+    )
+
+
+def _re_scanner() -> Callable[[str], List[Set[str]]]:
+    """Scan with one fused regex per tier"""
+    fused_tiers = [_fuse(patterns) for patterns in _TIERS]
+    
+    def scan(content: str) -> List[Set[str]]:
+        return [{match.lastgroup for match in fused.finditer(content)} for fused in fused_tiers]
+    
+    return scan
+
+
+def _hyperscan_scanner() -> Callable[[str], List[Set[str]]]:
+    """
+    Scan every tier in a single pass with a Hyperscan block-mode database
+    
+    Scratch space is per database and not thread-safe, so each thread that
+    scans gets its own. Hyperscan rejects word boundaries in UCP mode, so
+    its classes are ASCII-only; _scan normalizes input so that this never
+    misses a match the re scanner finds.
+    """
+    expressions = []
+    indicators = []  # expression id -> (tier, indicator)
+    for tier, patterns in enumerate(_TIERS):
+        for pattern, indicator in patterns:
+            expressions.append(pattern.encode())
+            indicators.append((tier, indicator))
+    
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8,
+    )
+    local = threading.local()
+    
+    def on_match(expression_id, start, end, flags, matched):
+        tier, indicator = indicators[expression_id]
+        matched[tier].add(indicator)
+    
+    def scan(content: str) -> List[Set[str]]:
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            scratch = local.scratch = hyperscan.Scratch(database)
+        matched = [set() for _ in _TIERS]
+        database.scan(content.encode(), match_event_handler=on_match, context=matched, scratch=scratch)
+        return matched
+    
+    return scan
+
+
+# Hyperscan when installed and enabled (x86 only); otherwise CPython re
+_scan_tiers = (
+    _hyperscan_scanner()
+    if hyperscan is not None and settings.RISK_DETECTION_HYPERSCAN
+    else _re_scanner()
+)
+
+# Maps the characters where Unicode and ASCII regex semantics disagree onto
+# ASCII equivalents: whitespace other than space/newline (e.g. NBSP, thin
+# space) and the non-ASCII letters that case-insensitively match i, s and k.
+# Neither scanner's results change on normalized text except that Hyperscan
+# then agrees with re ('.' still stops at newlines, as it does in both).
+_SCAN_NORMALIZATION = str.maketrans({
+    **{chr(c): " " for c in range(0x3001) if chr(c).isspace() and chr(c) not in " \n"},
+    "\u0130": "i",  # İ
+    "\u0131": "i",  # ı
+    "\u017f": "s",  # ſ
+    "\u212a": "k",  # Kelvin sign
+})
+
+# Short replies ("ok", "thanks") repeat constantly; long messages rarely do
+# and would only evict them
+SCAN_CACHE_MAX_LENGTH = 256
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan_cached(content: str) -> Tuple[FrozenSet[str], ...]:
+    return tuple(frozenset(matched) for matched in _scan_tiers(content))
+
+
+def _scan(content: str) -> Sequence[Set[str]]:
+    """
+    Matched indicators per tier, memoized for short messages
+    
+    Only the pattern scan is cached; sentiment is applied afterwards so
+    scores stay exact.
+    """
+    content = content.translate(_SCAN_NORMALIZATION)
+    if len(content) <= SCAN_CACHE_MAX_LENGTH:
+        return _scan_cached(content)
+    return _scan_tiers(content)
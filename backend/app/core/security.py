@@ -1,15 +1,40 @@
 """Security utilities for authentication and authorization"""
 
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. Hashing is CPU-bound (hundreds of ms at the
+# default cost); async callers should use run_password_task.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Dedicated pool for bcrypt. The bcrypt extension releases the GIL, so
+# threads hash in parallel; one per core caps the CPU a login burst can take
+# and keeps it from queueing behind other work on the default executor.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password"
+)
+
+# Verified token payloads keyed by a digest of the raw token. Entries never
+# outlive the token's own exp claim.
+TOKEN_CACHE_TTL = 60  # seconds
+TOKEN_CACHE_MAXSIZE = 50_000
+
+_token_cache: Dict[bytes, Tuple[float, dict]] = {}
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -19,6 +44,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(truncated, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if its hash uses an outdated cost, return a
+    replacement hash computed with the current settings
+    """
+    truncated = plain_password[:72]
+    return pwd_context.verify_and_update(truncated, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Generate password hash"""
     # Truncate to 72 characters for bcrypt compatibility
@@ -26,6 +63,17 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(truncated)
 
 
+async def run_password_task(func, *args):
+    """Run a password hashing helper on the dedicated password pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
+
+def shutdown_password_executor() -> None:
+    """Stop the password pool's threads at application shutdown"""
+    _password_executor.shutdown(wait=False, cancel_futures=True)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -48,12 +96,32 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and validate JWT token"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    
+    cached = _token_cache.get(key)
+    if cached:
+        if cached[0] > now:
+            return cached[1]
+        # Expired entry: drop it so a token that no longer verifies
+        # doesn't linger until size-based eviction
+        del _token_cache[key]
+    
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
+    
+    expires_at = now + TOKEN_CACHE_TTL
+    if "exp" in payload:
+        expires_at = min(expires_at, payload["exp"])
+    
+    if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[key] = (expires_at, payload)
+    
+    return payload
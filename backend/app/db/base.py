@@ -1,6 +1,12 @@
 """SQLAlchemy base configuration"""
 
+from sqlalchemy import func, literal_column
 from sqlalchemy.ext.declarative import declarative_base
 
 
 Base = declarative_base()
+
+
+def utcnow():
+    """Database-side UTC timestamp, matching the naive UTC DateTime columns"""
+    return func.timezone(literal_column("'utc'"), func.now())
@@ -1,7 +1,7 @@
 """Circle (community group) models"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -31,6 +31,11 @@ class Circle(Base):
     memberships = relationship("CircleMembership", back_populates="circle", cascade="all, delete-orphan")
     posts = relationship("Post", back_populates="circle", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Admin circle stats: largest circles first, paginated
+        Index("ix_circles_member_count", member_count.desc(), id),
+    )
+    
     def __repr__(self):
         return f"<Circle {self.name}>"
 
@@ -51,5 +56,10 @@ class CircleMembership(Base):
     user = relationship("User", backref="circle_memberships")
     circle = relationship("Circle", back_populates="memberships")
     
+    __table_args__ = (
+        # One membership per user and circle; serves every membership check
+        Index("uq_circle_memberships_circle_user", circle_id, user_id, unique=True),
+    )
+    
     def __repr__(self):
         return f"<CircleMembership user={self.user_id} circle={self.circle_id}>"
@@ -1,7 +1,7 @@
 """Conversation and Message models"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Float, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Float, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 import uuid
@@ -94,5 +94,14 @@ class Message(Base):
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
     
+    __table_args__ = (
+        # Conversation history and per-conversation count/last-message lookups
+        Index(
+            "ix_messages_conversation_created",
+            conversation_id,
+            created_at.desc(),
+        ),
+    )
+    
     def __repr__(self):
         return f"<Message {self.id} role={self.role.value}>"
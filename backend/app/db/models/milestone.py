@@ -1,7 +1,7 @@
 """User milestone model"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -25,5 +25,10 @@ class UserMilestone(Base):
     # Relationships
     user = relationship("User", back_populates="milestones")
     
+    __table_args__ = (
+        # Each milestone is awarded once; lets awards use ON CONFLICT DO NOTHING
+        Index("uq_user_milestones_user_type", user_id, milestone_type, unique=True),
+    )
+    
     def __repr__(self):
         return f"<UserMilestone {self.milestone_type}>"
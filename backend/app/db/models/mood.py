@@ -1,7 +1,7 @@
 """Mood tracking model"""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 import uuid
@@ -35,5 +35,10 @@ class MoodEntry(Base):
     # Relationships
     user = relationship("User", back_populates="mood_entries")
     
+    __table_args__ = (
+        # Per-user history, streaks and trend windows, newest first
+        Index("ix_mood_entries_user_created", user_id, created_at.desc()),
+    )
+    
     def __repr__(self):
         return f"<MoodEntry {self.id} score={self.mood_score}>"
@@ -1,7 +1,7 @@
 """Guided Path models for structured mental health journeys"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Float
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Float, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
@@ -35,6 +35,11 @@ class Path(Base):
     steps = relationship("PathStep", back_populates="path", cascade="all, delete-orphan", order_by="PathStep.order_index")
     user_progress = relationship("UserPathProgress", back_populates="path", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Path catalog: keyset pagination, most enrolled first
+        Index("ix_paths_enrollment_count", enrollment_count.desc(), id.desc()),
+    )
+    
     def __repr__(self):
         return f"<Path {self.name}>"
 
@@ -65,6 +70,11 @@ class PathStep(Base):
     # Relationships
     path = relationship("Path", back_populates="steps")
     
+    __table_args__ = (
+        # Path.steps loads ordered by order_index
+        Index("ix_path_steps_path_order", path_id, order_index),
+    )
+    
     def __repr__(self):
         return f"<PathStep {self.title}>"
 
@@ -93,5 +103,10 @@ class UserPathProgress(Base):
     user = relationship("User", backref="path_progress")
     path = relationship("Path", back_populates="user_progress")
     
+    __table_args__ = (
+        # One enrollment per user and path; serves every progress lookup
+        Index("uq_user_path_progress_user_path", user_id, path_id, unique=True),
+    )
+    
     def __repr__(self):
         return f"<UserPathProgress user={self.user_id} path={self.path_id} progress={self.progress_percentage}%>"
@@ -1,9 +1,9 @@
 """Post and Reaction models for community circles"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, backref
 import uuid
 import enum
 
@@ -44,9 +44,34 @@ class Post(Base):
     circle = relationship("Circle", back_populates="posts")
     user = relationship("User", foreign_keys=[user_id], backref="posts")
     reviewed_by = relationship("User", foreign_keys=[reviewed_by_id])
-    parent = relationship("Post", remote_side=[id], backref="replies")
+    parent = relationship("Post", remote_side=[id], backref=backref("replies", order_by=created_at))
     reactions = relationship("PostReaction", back_populates="post", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Moderation queue: flagged posts by severity, newest first
+        Index(
+            "ix_posts_flagged_severity_created",
+            flag_severity.desc(),
+            created_at.desc(),
+            postgresql_where=text("is_flagged = true"),
+        ),
+        # Circle feed: keyset pagination over visible top-level posts, newest first
+        Index(
+            "ix_posts_circle_top_level_visible",
+            circle_id,
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("parent_id IS NULL AND is_hidden = false"),
+        ),
+        # Visible replies of a page of posts, oldest first
+        Index(
+            "ix_posts_parent_visible_created",
+            parent_id,
+            created_at,
+            postgresql_where=text("is_hidden = false"),
+        ),
+    )
+    
     def __repr__(self):
         return f"<Post {self.id} in circle={self.circle_id}>"
 
@@ -67,5 +92,10 @@ class PostReaction(Base):
     post = relationship("Post", back_populates="reactions")
     user = relationship("User", backref="post_reactions")
     
+    __table_args__ = (
+        # One reaction per user and post; add_reaction upserts on it
+        Index("uq_post_reactions_post_user", post_id, user_id, unique=True),
+    )
+    
     def __repr__(self):
         return f"<PostReaction {self.reaction_type} on post={self.post_id}>"
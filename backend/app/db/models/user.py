@@ -1,9 +1,10 @@
 """User model"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Float
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSON
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 import uuid
 
 from app.db.base import Base
@@ -51,5 +52,27 @@ class User(Base):
     milestones = relationship("UserMilestone", back_populates="user", cascade="all, delete-orphan")
     safety_plan = relationship("SafetyPlan", back_populates="user", uselist=False, cascade="all, delete-orphan")
     
+    @hybrid_property
+    def is_staff(self):
+        """Admin or moderator (usable in Python and as a SQL predicate)"""
+        return self.is_admin | self.is_moderator
+    
+    __table_args__ = (
+        # Admin at-risk queue: elevated-risk users, most recently assessed first
+        Index(
+            "ix_users_at_risk",
+            last_risk_assessment.desc(),
+            id,
+            postgresql_where=text("risk_level IN ('high', 'critical')"),
+        ),
+        # Admin user search: substring ILIKE on username (requires pg_trgm)
+        Index(
+            "ix_users_username_trgm",
+            username,
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+    )
+    
     def __repr__(self):
         return f"<User {self.username} (anonymous={self.is_anonymous})>"
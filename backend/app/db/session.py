@@ -1,19 +1,59 @@
 """Database session management"""
 
+import uuid
+
+import orjson
+from loguru import logger
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB bind values with orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Engine options shared by the primary and read replica engines
+_engine_options = dict(
     echo=settings.ENVIRONMENT == "development",
-    future=True
+    future=True,
+    query_cache_size=2000,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # Short OLTP queries pay JIT compile cost without benefiting from it
+        "server_settings": {"jit": "off"},
+    },
+    # asyncpg already decodes uuid/timestamp with its binary C codecs; JSONB
+    # goes through text and is the one codec worth speeding up.
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads
 )
 
-# Create async session factory
+# Create async engine
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options)
+
+# Read-only engine for reporting queries. Points at the replica when one is
+# configured; otherwise shares the primary's pool. Transactions are opened
+# READ ONLY so an accidental write fails instead of hitting the primary.
+if settings.POSTGRES_READ_HOST:
+    read_engine = create_async_engine(settings.READ_DATABASE_URL, **_engine_options)
+else:
+    read_engine = engine
+
+read_engine = read_engine.execution_options(
+    postgresql_readonly=True,
+    isolation_level="REPEATABLE READ"
+)
+
+# Create async session factories
 AsyncSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
@@ -22,6 +62,14 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False
 )
 
+ReadSessionLocal = sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
 
 async def get_db() -> AsyncSession:
     """Dependency for getting database session"""
@@ -30,3 +78,41 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """Dependency for a read-only session (replica when configured)"""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def _hot_statements():
+    """Statements executed on (nearly) every request, keyed like the endpoints build them"""
+    from app.db.models.user import User
+    from app.db.models.post import Post
+
+    no_id = uuid.UUID(int=0)
+    return [
+        # get_current_user
+        select(User).where(User.id == no_id),
+        # reply_to_post / add_reaction / flag_post
+        select(Post).where(Post.id == no_id),
+    ]
+
+
+async def warm_query_cache():
+    """
+    Populate the engine's compiled-statement cache at startup
+    
+    Cache keys ignore bound values, so executing each hot statement once
+    with a placeholder id means the first real request skips compilation.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            for stmt in _hot_statements():
+                await session.execute(stmt)
+    except Exception as e:
+        logger.warning(f"Query cache warmup skipped: {e}")
@@ -3,10 +3,13 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import redis.asyncio as redis
 
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.db.session import warm_query_cache
+from app.core.security import shutdown_password_executor
 
 
 # Global Redis client
@@ -30,10 +33,13 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Redis connected: {settings.REDIS_URL}")
     
+    await warm_query_cache()
+    
     yield
     
     # Shutdown
     await redis_client.close()
+    shutdown_password_executor()
     logger.info("👋 Dala backend shutting down...")
 
 
@@ -41,7 +47,8 @@ app = FastAPI(
     title="Dala Mental Health API",
     description="Privacy-first mental health support platform with AI companion",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -51,6 +58,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
 # Include API routes
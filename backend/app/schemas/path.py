@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 
 
@@ -12,11 +12,12 @@ class PathStepBase(BaseModel):
 
 
 class PathStepResponse(PathStepBase):
-    id: int
-    path_id: int
+    id: UUID
+    path_id: UUID
     order_index: int
-    prompts: Optional[Dict[str, Any]] = None
-    resources: Optional[Dict[str, Any]] = None
+    # Seeded steps store objects; steps created without them default to []
+    prompts: Optional[Union[Dict[str, Any], List[Any]]] = None
+    resources: Optional[Union[Dict[str, Any], List[Any]]] = None
     
     class Config:
         from_attributes = True
@@ -47,7 +48,8 @@ class UserPathProgressResponse(BaseModel):
     is_completed: bool = False
     started_at: datetime
     completed_at: Optional[datetime] = None
-    last_activity: datetime
+    # Stored as last_accessed_at on the model
+    last_activity: datetime = Field(validation_alias=AliasChoices("last_activity", "last_accessed_at"))
     
     class Config:
         from_attributes = True
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
@@ -33,6 +33,13 @@ class PostResponse(PostBase):
     
     class Config:
         from_attributes = True
+    
+    @model_validator(mode="after")
+    def default_author_name(self):
+        """Derive the display name during validation unless one was given"""
+        if self.author_name is None:
+            self.author_name = "Anonymous" if self.is_anonymous else f"User {self.user_id}"
+        return self
 
 
 class PostWithRepliesResponse(PostResponse):
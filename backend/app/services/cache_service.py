@@ -1,7 +1,7 @@
 """Redis caching service for sessions, rate limiting, and conversation context"""
 
 import json
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Tuple
 from datetime import timedelta
 import redis.asyncio as redis
 from loguru import logger
@@ -59,7 +59,8 @@ class CacheService:
         user_id: str,
         endpoint: str = "default",
         limit: int = None,
-        window: int = None
+        window: int = None,
+        mark_active: bool = False
     ) -> tuple[bool, int]:
         """
         Token bucket rate limiting
@@ -69,6 +70,7 @@ class CacheService:
             endpoint: Endpoint identifier
             limit: Max requests (defaults to settings)
             window: Time window in seconds (defaults to settings)
+            mark_active: Also mark the user active, in the same round-trip
             
         Returns:
             Tuple of (is_allowed, remaining_requests)
@@ -81,12 +83,18 @@ class CacheService:
         key = f"ratelimit:{endpoint}:{user_id}"
         
         try:
-            # Increment counter
-            count = await self.redis.incr(key)
-            
-            # Set expiry on first request
-            if count == 1:
-                await self.redis.expire(key, window)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                # Increment counter
+                pipe.incr(key)
+                
+                # Set expiry on first request (NX keeps the window fixed)
+                pipe.expire(key, window, nx=True)
+                
+                if mark_active:
+                    pipe.sadd(self.ACTIVE_USERS_KEY, user_id)
+                    pipe.expire(self.ACTIVE_USERS_KEY, self.ACTIVE_USERS_WINDOW)
+                
+                count, *_ = await pipe.execute()
             
             is_allowed = count <= limit
             remaining = max(0, limit - count)
@@ -197,24 +205,108 @@ class CacheService:
     
     # ============= Active User Tracking =============
     
+    ACTIVE_USERS_KEY = "active_users"
+    ACTIVE_USERS_WINDOW = 300  # 5 min window
+    
     async def mark_user_active(self, user_id: str):
         """Mark user as active (for analytics)"""
-        key = "active_users"
         try:
-            await self.redis.sadd(key, user_id)
-            await self.redis.expire(key, 300)  # 5 min window
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.sadd(self.ACTIVE_USERS_KEY, user_id)
+                pipe.expire(self.ACTIVE_USERS_KEY, self.ACTIVE_USERS_WINDOW)
+                await pipe.execute()
         except Exception as e:
             logger.error(f"Failed to mark user active: {e}")
     
     async def get_active_user_count(self) -> int:
         """Get count of active users"""
-        key = "active_users"
         try:
-            return await self.redis.scard(key)
+            return await self.redis.scard(self.ACTIVE_USERS_KEY)
         except Exception as e:
             logger.error(f"Failed to get active user count: {e}")
             return 0
     
+    # ============= Admin Dashboard Caching =============
+    
+    ADMIN_DASHBOARDS = ("analytics", "moderation_summary")
+    
+    async def cache_admin_dashboard(
+        self,
+        name: str,
+        payload: bytes,
+        expire: int = 60
+    ):
+        """Cache an encoded admin dashboard JSON payload shared by all admins"""
+        key = f"admin_dashboard:{name}"
+        try:
+            await self.redis.setex(key, expire, payload)
+        except Exception as e:
+            logger.error(f"Failed to cache admin dashboard: {e}")
+    
+    async def get_admin_dashboard(self, name: str) -> Optional[str]:
+        """Get cached admin dashboard payload as raw JSON"""
+        key = f"admin_dashboard:{name}"
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            logger.error(f"Failed to get admin dashboard: {e}")
+            return None
+    
+    async def invalidate_admin_dashboards(self):
+        """Drop all cached admin dashboards after a moderation action"""
+        keys = [f"admin_dashboard:{name}" for name in self.ADMIN_DASHBOARDS]
+        try:
+            await self.redis.delete(*keys)
+        except Exception as e:
+            logger.error(f"Failed to invalidate admin dashboards: {e}")
+    
+    # ============= Path Catalog Caching =============
+    
+    PATH_CATALOG_KEY = "path_catalog"
+    
+    async def cache_path_catalog_page(
+        self,
+        page: str,
+        payload: bytes,
+        next_cursor: Optional[str],
+        expire: int = 60
+    ):
+        """
+        Cache an encoded page of the path catalog and its next-page cursor.
+        All pages share one hash that expires (or is invalidated) together,
+        so cursors never stitch pages cached at different times.
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(self.PATH_CATALOG_KEY, mapping={
+                    page: payload,
+                    f"{page}:next": next_cursor or ""
+                })
+                pipe.expire(self.PATH_CATALOG_KEY, expire, nx=True)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to cache path catalog: {e}")
+    
+    async def get_path_catalog_page(self, page: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Get a cached path catalog page as (raw JSON, next cursor)"""
+        try:
+            payload, next_cursor = await self.redis.hmget(
+                self.PATH_CATALOG_KEY, page, f"{page}:next"
+            )
+        except Exception as e:
+            logger.error(f"Failed to get path catalog: {e}")
+            return None
+        if payload is None:
+            return None
+        return payload, next_cursor or None
+    
+    async def invalidate_path_catalog(self):
+        """Drop every cached path catalog page after paths or enrollments change"""
+        try:
+            await self.redis.delete(self.PATH_CATALOG_KEY)
+        except Exception as e:
+            logger.error(f"Failed to invalidate path catalog: {e}")
+    
     # ============= LLM Response Caching (Optional) =============
     
     async def cache_llm_response(
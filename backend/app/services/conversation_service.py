@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from loguru import logger
 import uuid
 
+from app.db.base import utcnow
 from app.db.models.conversation import Conversation, Message, MessageRole
 from app.db.models.user import User
 from app.db.models.mood import MoodEntry
@@ -160,7 +161,7 @@ class ConversationService:
         """Build conversation context from database and memory cache"""
         
         # Get mood trend
-        cutoff = datetime.utcnow() - timedelta(days=7)
+        cutoff = utcnow() - timedelta(days=7)
         result = await db.execute(
             select(func.avg(MoodEntry.mood_score))
             .where(
@@ -327,9 +328,10 @@ class ConversationService:
                     Message.risk_score.isnot(None)
                 )
                 .order_by(desc(Message.created_at))
-                .limit(10)
+                .limit(5)
             )
-            risk_history = [score for (score,) in recent_messages.all() if score]
+            # Oldest first, as should_update_user_risk_level expects
+            risk_history = [score for (score,) in reversed(recent_messages.all()) if score]
             
             # Determine if user risk level should be updated
             should_update, new_risk_level = RiskDetector.should_update_user_risk_level(
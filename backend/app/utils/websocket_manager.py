@@ -1,10 +1,21 @@
 """WebSocket connection manager"""
 
-from typing import Dict, List
+from typing import Any, Dict, List
+import orjson
 from fastapi import WebSocket
 from loguru import logger
 
 
+async def send_json(websocket: WebSocket, payload: Any):
+    """
+    Send payload as a JSON text frame, encoded with orjson
+    
+    Text rather than binary frames, since browser clients JSON.parse the
+    frame data as a string.
+    """
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
 class WebSocketManager:
     """Manage WebSocket connections"""
     
@@ -39,7 +50,7 @@ class WebSocketManager:
             disconnected = []
             for connection in self.active_connections[user_id]:
                 try:
-                    await connection.send_json(message)
+                    await send_json(connection, message)
                 except Exception as e:
                     logger.error(f"Failed to send message to {user_id}: {e}")
                     disconnected.append(connection)
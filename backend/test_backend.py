@@ -1,6 +1,7 @@
 """Test script to verify backend setup"""
 
 import asyncio
+import uuid
 import httpx
 from loguru import logger
 
@@ -83,6 +84,84 @@ async def test_backend():
         logger.info(f"  Average: {history['average_score']}")
         logger.info(f"  Trend: {history['trend']}")
         
+        # Test 7: Create circle and post
+        logger.info("Testing circle and post creation...")
+        response = await client.post(
+            f"{BASE_URL}/api/v1/circles",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "name": f"Test Circle {uuid.uuid4().hex[:8]}",
+                "topic": "general",
+                "description": "Test circle"
+            }
+        )
+        assert response.status_code == 201
+        circle_id = response.json()["id"]
+        response = await client.post(
+            f"{BASE_URL}/api/v1/posts/circles/{circle_id}/posts",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"content": "Test post"}
+        )
+        assert response.status_code == 201
+        post_id = response.json()["id"]
+        logger.success(f"✓ Circle {circle_id} and post {post_id} created")
+        
+        # Test 8: Join circle as a second user (membership insert + count
+        # update run as one statement)
+        logger.info("Testing circle join...")
+        response = await client.post(
+            f"{BASE_URL}/api/v1/auth/anonymous-session",
+            json={"privacy_consent": True}
+        )
+        assert response.status_code == 201
+        member_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        response = await client.post(
+            f"{BASE_URL}/api/v1/circles/{circle_id}/join", headers=member_headers
+        )
+        assert response.status_code == 204
+        response = await client.post(
+            f"{BASE_URL}/api/v1/circles/{circle_id}/join", headers=member_headers
+        )
+        assert response.status_code == 400
+        logger.success("✓ Joined circle; repeat join rejected")
+        
+        # Test 9: Add and remove a reaction
+        logger.info("Testing post reactions...")
+        response = await client.post(
+            f"{BASE_URL}/api/v1/posts/posts/{post_id}/reactions",
+            headers=member_headers,
+            json={"reaction_type": "support"}
+        )
+        assert response.status_code == 204
+        response = await client.get(
+            f"{BASE_URL}/api/v1/posts/circles/{circle_id}/posts", headers=member_headers
+        )
+        assert response.status_code == 200
+        assert response.json()[0]["reaction_count"] == 1
+        response = await client.delete(
+            f"{BASE_URL}/api/v1/posts/posts/{post_id}/reactions", headers=member_headers
+        )
+        assert response.status_code == 204
+        response = await client.delete(
+            f"{BASE_URL}/api/v1/posts/posts/{post_id}/reactions", headers=member_headers
+        )
+        assert response.status_code == 404
+        logger.success("✓ Reaction added and removed")
+        
+        # Test 10: Leave circle
+        logger.info("Testing circle leave...")
+        response = await client.delete(
+            f"{BASE_URL}/api/v1/circles/{circle_id}/leave", headers=member_headers
+        )
+        assert response.status_code == 204
+        response = await client.get(
+            f"{BASE_URL}/api/v1/circles/{circle_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+        assert response.json()["member_count"] == 1
+        logger.success("✓ Left circle")
+        
         logger.success("\n✓ All tests passed! Backend is working correctly.")
         logger.info(f"\nYou can now test WebSocket chat:")
         logger.info(f"  Conversation ID: {conversation_id}")